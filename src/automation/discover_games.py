@@ -1,24 +1,34 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
-from dataclasses import asdict, dataclass
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
 from zoneinfo import ZoneInfo
 
 from src.connectors.nba.scoreboard_client import NBAScoreboardClient
+from src.automation.kalshi_events import fetch_events, open_events_url
+from src.core.jsonio import write_json
+from src.core.timeutil import to_epoch_ns
 
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
-KALSHI_BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 SERIES_TICKER = "KXNBAGAME"
+_EVENTS_URL = open_events_url(SERIES_TICKER)
+
+# "KXNBAGAME-25NOV22LACCHA" -> ("25", "NOV", "22", "LAC", "CHA")
+_TICKER_RE = re.compile(r"^[^-]+-(\d{2})([A-Z]{3})(\d{2})([A-Z]{3})([A-Z]{3})")
+_MONTHS = {
+    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
+    "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12,
+}
 
 # Centralized storage for jobs
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -28,7 +38,7 @@ logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 log = logging.getLogger("discover_games")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Job:
     game_date: str        # YYYY-MM-DD
     game_id: str
@@ -36,7 +46,8 @@ class Job:
     away_team: str
     tipoff_utc: Optional[str]   # ISO string or None
     event_ticker: str
-    market_tickers: List[str]
+    market_tickers: Tuple[str, ...]
+    tipoff_epoch_ns: Optional[int] = None   # tipoff_utc as epoch-ns
 
 
 # ---------------------------------------------------------------------------
@@ -77,73 +88,44 @@ def _parse_tipoff_utc(game_date: date, status_text: str) -> Optional[str]:
         # Convert to UTC
         dt_utc = dt_et.astimezone(ZoneInfo("UTC"))
         return dt_utc.isoformat()
-    except Exception:
+    except ValueError:  # strptime on an unexpected status text
         return None
 
 
 def _fetch_kalshi_events() -> List[Dict[str, Any]]:
     """Fetch all open NBA events from Kalshi."""
-    url = f"{KALSHI_BASE_URL}/events"
-    params = {
-        "series_ticker": SERIES_TICKER,
-        "with_nested_markets": "true",
-        "status": "open",
-        "limit": 200,
-    }
-
-    log.info(f"Fetching Kalshi events from {url}")
-    try:
-        resp = requests.get(url, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception as e:
-        log.error(f"Failed to fetch Kalshi events: {e}")
-        return []
-
-    if isinstance(data, dict):
-        events = data.get("events", []) or []
-    elif isinstance(data, list):
-        events = data
-    else:
-        events = []
-
-    return events
+    log.info(f"Fetching Kalshi events from {_EVENTS_URL}")
+    return fetch_events(_EVENTS_URL)
 
 
 def _parse_nba_event_ticker(event_ticker: str) -> Optional[Tuple[date, str, str]]:
     """
     Parse 'KXNBAGAME-25NOV22LACCHA' -> (date(2025, 11, 22), 'LAC', 'CHA')
     """
+    m = _TICKER_RE.match(event_ticker)
+    if not m:
+        return None
+
+    yy, mon_str, day, away, home = m.groups()
+    month = _MONTHS.get(mon_str)
+    if month is None:
+        return None
+
     try:
-        _, suffix = event_ticker.split("-", 1)
-        if len(suffix) < 13:
-            return None
-
-        date_code = suffix[:7]  # "25NOV22"
-        yy = int(date_code[:2])
-        mon_str = date_code[2:5]
-        day = int(date_code[5:7])
-
-        month = datetime.strptime(mon_str, "%b").month
-        year = 2000 + yy
-        event_dt = date(year, month, day)
-
-        away = suffix[7:10]
-        home = suffix[10:13]
-        return event_dt, away, home
-    except Exception:
+        event_dt = date(2000 + int(yy), month, int(day))
+    except ValueError:
         return None
+    return event_dt, away, home
 
 
 def _extract_winner_markets(event: Dict[str, Any]) -> List[str]:
     """Find the two 'Winner' moneyline markets in an event."""
-    markets = event.get("markets") or []
-    tickers = []
-    for m in markets:
-        if m.get("market_type") == "binary" and "winner" in (m.get("title") or "").lower():
-            if t := m.get("ticker"):
-                tickers.append(t)
-    return tickers
+    return [
+        t for m in event.get("markets") or ()
+        if m.get("market_type") == "binary"
+        and "winner" in (m.get("title") or "").lower()
+        and (t := m.get("ticker"))
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -153,27 +135,25 @@ def _extract_winner_markets(event: Dict[str, Any]) -> List[str]:
 def discover_jobs_for_date(target_date: date) -> List[Job]:
     log.info(f"Discovering jobs for {target_date}")
 
-    # 1. Get NBA Schedule
+    # 1+2. Get NBA Schedule and Kalshi Events (independent, so fetch concurrently)
     client = NBAScoreboardClient()
-    nba_snapshots = client.fetch_scoreboard_for_date(target_date)
-
-    # 2. Get Kalshi Events
-    kalshi_events = _fetch_kalshi_events()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        nba_future = pool.submit(client.fetch_scoreboard_for_date, target_date)
+        kalshi_future = pool.submit(_fetch_kalshi_events)
+        nba_snapshots = nba_future.result()
+        kalshi_events = kalshi_future.result()
     log.info(f"Found {len(kalshi_events)} Kalshi events")
 
-    kalshi_index = {}
-    for e in kalshi_events:
-        et = e.get("event_ticker") or e.get("ticker")
-        if not et:
-            continue
-
-        parsed = _parse_nba_event_ticker(et)
-        if not parsed:
-            continue
-
-        evt_date, away, home = parsed
-        if evt_date == target_date:
-            kalshi_index[(home, away)] = e
+    # (home, away) -> event, keeping only events dated target_date
+    parsed_events = (
+        (_parse_nba_event_ticker(e.get("event_ticker") or e.get("ticker") or ""), e)
+        for e in kalshi_events
+    )
+    kalshi_index = {
+        (parsed[2], parsed[1]): e
+        for parsed, e in parsed_events
+        if parsed and parsed[0] == target_date
+    }
 
     jobs = []
 
@@ -199,7 +179,8 @@ def discover_jobs_for_date(target_date: date) -> List[Job]:
             away_team=snap.away_team,
             tipoff_utc=tipoff_utc,
             event_ticker=k_event.get("event_ticker"),
-            market_tickers=market_tickers
+            market_tickers=tuple(market_tickers),
+            tipoff_epoch_ns=to_epoch_ns(tipoff_utc),
         )
         jobs.append(job)
 
@@ -211,8 +192,7 @@ def _save_jobs(jobs: List[Job], target_date: date):
     JOBS_DIR.mkdir(parents=True, exist_ok=True)
     filename = JOBS_DIR / f"jobs_{target_date.isoformat()}.json"
 
-    with open(filename, "w") as f:
-        json.dump([asdict(j) for j in jobs], f, indent=2)
+    write_json(filename, jobs, indent=True)
 
     log.info(f"Saved jobs to {filename}")
 
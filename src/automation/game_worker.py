@@ -1,122 +1,321 @@
 from __future__ import annotations
-from src.strategies.composite import CompositeStrategy
-from src.strategies.registry import get_strategy_class
-from src.core.trade_logger import TradeLogger
-from src.storage.state_writer import PredictEngineStateWriter
-from src.engine.live_engine import LiveEngine
-from src.engine.broker import KalshiBroker
-from src.connectors.nba.scoreboard_client import NBAScoreboardClient
-from src.connectors.kalshi.nba_state_merger import merge_nba_and_kalshi_streams
-from src.connectors.kalshi.http_client import KalshiHTTPClient
-from src.connectors.kalshi.ticker_stream import ticker_stream
+from src.core.aio import install_uvloop
+from src.core.jsonio import JSONDecodeError, read_json
+from src.core.timeutil import to_epoch_ns
+from src.storage.state_writer import PredictEngineStateWriter, drain_state_queue
 
 import argparse
 import asyncio
+import functools
 import logging
-import sys
-import json
 import time
-from datetime import datetime, date, timedelta, timezone
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, date, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
 
-# Fix path to allow running as module
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+import requests
 
+if TYPE_CHECKING:
+    from src.connectors.kalshi.http_client import KalshiHTTPClient
 
-# Dynamic Strategy Loading
+# Workers are launched as modules from the project root (python -m ...),
+# so `src` is importable without touching sys.path.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s][%(levelname)s][Worker-%(message)s]",
-    datefmt="%H:%M:%S"
-)
 log = logging.getLogger("worker")
 
-JOBS_DIR = PROJECT_ROOT / "src" / "storage" / "jobs"
-CONFIG_PATH = PROJECT_ROOT / "src" / "config" / "live_config.json"
-PREGAME_MINUTES = 10
+# How often the loop asks the REST API whether all markets are terminal
+REST_CHECK_INTERVAL_SECS = 60
 
-# Terminal statuses that mean "Game Over, Go Home"
-TERMINAL_STATUSES = {"finalized", "settled", "closed", "final"}
+# Write-behind buffer between the trading loop and the state file
+STATE_QUEUE_MAXSIZE = 1024
+STATE_BATCH_SIZE = 64
+STATE_BATCH_MAX_WAIT = 1.0
 
+# Shared default for missing nested dicts in the hot loop; never mutate
+_EMPTY: Dict[str, Any] = {}
 
-def _load_config():
-    if not CONFIG_PATH.exists():
-        raise FileNotFoundError(f"Config not found at {CONFIG_PATH}")
-    with open(CONFIG_PATH, "r") as f:
-        return json.load(f)
 
+# ---------------------------------------------------------------------------
+# Per-sport settings
+# ---------------------------------------------------------------------------
 
-def _get_tipoff_from_job(game_date: str, event_ticker: str) -> datetime | None:
-    jobs_path = JOBS_DIR / f"jobs_{game_date}.json"
-    if not jobs_path.exists():
-        return None
+@dataclass(frozen=True)
+class SportProfile:
+    """
+    Everything that differs between the NBA and NFL workers.
+    """
+    sport: str
+    jobs_dir: Path
+    config_path: Path
+    config_required: bool       # NBA refuses to run without a config
+    states_dir: Path
+    pregame_minutes: int
+    # Terminal statuses that mean "Game Over, Go Home"
+    terminal_statuses: frozenset[str]
+    raw_context_key: str        # state["context"][key]["status"]
+    poll_interval: float
+    heartbeat_every: int
+
+
+SPORT_PROFILES: Dict[str, SportProfile] = {
+    "nba": SportProfile(
+        sport="nba",
+        jobs_dir=PROJECT_ROOT / "src" / "storage" / "jobs",
+        config_path=PROJECT_ROOT / "src" / "config" / "live_config.json",
+        config_required=True,
+        states_dir=PROJECT_ROOT / "src" / "storage" / "kalshi" / "merged" / "states",
+        pregame_minutes=10,
+        terminal_statuses=frozenset({"finalized", "settled", "closed", "final"}),
+        raw_context_key="nba_raw",
+        poll_interval=2.0,
+        heartbeat_every=100,
+    ),
+    "nfl": SportProfile(
+        sport="nfl",
+        jobs_dir=PROJECT_ROOT / "src" / "storage" / "jobs" / "nfl",
+        config_path=PROJECT_ROOT / "src" / "config" / "nfl_live_config.json",
+        config_required=False,
+        states_dir=PROJECT_ROOT / "src" / "storage" / "kalshi" / "merged" / "nfl_states",
+        pregame_minutes=30,
+        terminal_statuses=frozenset({"finalized", "settled", "closed"}),
+        raw_context_key="nfl_raw",
+        poll_interval=1.0,
+        heartbeat_every=300,
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Config / jobs
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=2)
+def _read_config(config_path: Path, mtime_ns: int) -> dict:
+    # Keyed by mtime so an edited config is re-read; callers must not mutate.
+    return read_json(config_path)
+
+
+def _load_config(profile: SportProfile):
+    config_path = profile.config_path
+    if not config_path.exists():
+        if profile.config_required:
+            raise FileNotFoundError(f"Config not found at {config_path}")
+        return {}
+    return _read_config(config_path, config_path.stat().st_mtime_ns)
+
+
+# Parsed jobs files: jobs_path -> (mtime, {event_ticker: tipoff_epoch_ns})
+_JOBS_CACHE: dict[str, tuple[float, dict[str, int | None]]] = {}
+
+
+def _job_tipoff_ns(job: dict) -> int | None:
+    """
+    Tipoff as epoch-ns. Jobs files written before discovery stored
+    tipoff_epoch_ns only carry the ISO string, so parse that once here.
+    """
+    ns = job.get("tipoff_epoch_ns")
+    if ns is not None:
+        return int(ns)
+    return to_epoch_ns(job.get("tipoff_utc"))
+
+
+def _load_tipoff_index(jobs_path: Path) -> dict[str, int | None]:
+    """
+    Returns {event_ticker: tipoff_epoch_ns} for a jobs file, re-parsing only when
+    the file's mtime changes.
+    """
+    key = str(jobs_path)
+    mtime = jobs_path.stat().st_mtime
+    cached = _JOBS_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    jobs = read_json(jobs_path)
+    index = {job.get("event_ticker"): _job_tipoff_ns(job) for job in jobs}
+    _JOBS_CACHE[key] = (mtime, index)
+    return index
+
+
+def _get_tipoff_from_job(jobs_dir: Path, game_date: str, event_ticker: str) -> int | None:
+    """
+    Returns the job's tipoff as epoch-nanoseconds, or None if unknown.
+    """
+    jobs_path = jobs_dir / f"jobs_{game_date}.json"
     try:
-        with open(jobs_path, "r") as f:
-            jobs = json.load(f)
-        for job in jobs:
-            if job.get("event_ticker") == event_ticker:
-                tipoff_str = job.get("tipoff_utc")
-                if tipoff_str:
-                    return datetime.fromisoformat(tipoff_str)
-    except Exception:
-        pass
-    return None
+        return _load_tipoff_index(jobs_path).get(event_ticker)
+    except (OSError, JSONDecodeError, ValueError, AttributeError):
+        # Missing/unreadable file, bad JSON, or entries that are not job objects
+        return None
+
 
+# ---------------------------------------------------------------------------
+# REST exit check / state recording
+# ---------------------------------------------------------------------------
 
-async def _check_markets_terminal(http_client: KalshiHTTPClient, tickers: list[str]) -> bool:
+async def _check_markets_terminal(
+    http_client: KalshiHTTPClient,
+    event_ticker: str,
+    tickers: list[str],
+    terminal_statuses: frozenset[str],
+) -> bool:
     """
     Returns True if ALL markets are in a terminal state (finalized/settled).
+    One event call with nested markets covers every ticker of the game.
     """
-    for t in tickers:
+    try:
+        # http_client is synchronous; run() uses its own threads
+        resp = await http_client.run(http_client.get_event, event_ticker)
+    except (requests.RequestException, ValueError) as e:
+        log.warning(f"Failed to check status for {event_ticker}: {e}")
+        return False  # Assume open if check fails to be safe
+
+    event = resp.get("event") or {}
+    markets = resp.get("markets") or event.get("markets") or []
+    statuses = {m.get("ticker"): (m.get("status") or "").lower() for m in markets}
+    # A ticker missing from the event is treated as open
+    return all(statuses.get(t) in terminal_statuses for t in tickers)
+
+
+async def _poll_markets_terminal(
+    http_client: KalshiHTTPClient,
+    event_ticker: str,
+    tickers: list[str],
+    terminal_statuses: frozenset[str],
+    done: asyncio.Event,
+) -> None:
+    """
+    Background task: every REST_CHECK_INTERVAL_SECS, ask REST whether all
+    markets are terminal and set `done` once they are.
+    """
+    while True:
+        await asyncio.sleep(REST_CHECK_INTERVAL_SECS)
         try:
-            # We run this in a thread because http_client is synchronous
-            resp = await asyncio.to_thread(http_client.get_market, t)
-            m = resp.get("market") or {}
-            status = m.get("status", "").lower()
-            if status not in TERMINAL_STATUSES:
-                return False
-        except Exception as e:
-            log.warning(f"Failed to check status for {t}: {e}")
-            return False  # Assume open if check fails to be safe
-    return True
+            terminal = await _check_markets_terminal(
+                http_client, event_ticker, tickers, terminal_statuses)
+        except Exception:
+            # Keep polling; a dead poller would re-raise in run_worker's finally
+            log.exception(f"Terminal-status check failed for {event_ticker}")
+            continue
+        if terminal:
+            done.set()
+            return
+
+
+def _enqueue_state(write_q: asyncio.Queue, state: dict) -> None:
+    """
+    Hands a state to the write-behind task without blocking the trading loop.
+    If the writer has fallen behind, the oldest buffered state is dropped.
+    """
+    entry = PredictEngineStateWriter.encode_state(state)
+    try:
+        write_q.put_nowait(entry)
+    except asyncio.QueueFull:
+        write_q.get_nowait()
+        write_q.task_done()
+        write_q.put_nowait(entry)
+        log.warning("State write queue full; dropped oldest state.")
 
 
+def _build_merged_stream(
+    profile: SportProfile,
+    *,
+    event_ticker: str,
+    game_id: str,
+    home_team: str,
+    away_team: str,
+    market_tickers: list[str],
+    game_date: str,
+    tipoff_ns: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Scoreboard poller + Kalshi ticker WS, merged into one state stream.
+    """
+    from src.connectors.kalshi.ticker_stream import ticker_stream
+
+    if profile.sport == "nba":
+        from src.connectors.nba.scoreboard_client import NBAScoreboardClient
+        from src.connectors.kalshi.nba_state_merger import merge_nba_and_kalshi_streams
+
+        # Note: poll_game might finish if NBA says Final, but WS keeps going.
+        score_stream = NBAScoreboardClient().poll_game(
+            game_id, poll_interval=profile.poll_interval, stop_on_final=True,
+            target_date=date.fromisoformat(game_date), tipoff_ns=tipoff_ns)
+        merge = merge_nba_and_kalshi_streams
+    else:
+        from src.connectors.nfl.scoreboard_client import get_scoreboard_broadcaster
+        from src.connectors.kalshi.nfl_state_merger import merge_nfl_and_kalshi_streams
+
+        # One ESPN poller is shared by every NFL game in the process
+        score_stream = get_scoreboard_broadcaster(profile.poll_interval).subscribe(
+            game_id, stop_on_final=True, tipoff_ns=tipoff_ns)
+        merge = merge_nfl_and_kalshi_streams
+
+    return merge(
+        event_ticker=event_ticker, game_id=game_id, home_team=home_team, away_team=away_team,
+        tick_stream=ticker_stream(market_tickers), scoreboard_stream=score_stream,
+        initial_markets=market_tickers
+    )
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
 async def run_worker(
     event_ticker: str,
     game_id: str,
     home_team: str,
     away_team: str,
     market_tickers: list[str],
-    game_date: str
+    game_date: str,
+    sport: str = "nba",
+    kalshi_http: Optional[KalshiHTTPClient] = None,
 ):
-    log.info(f"Initializing Worker | {away_team}@{home_team}")
+    """
+    Trades and records one game. The manager runs many of these as tasks in
+    one process and passes a shared `kalshi_http`; standalone runs build their own.
+    """
+    profile = SPORT_PROFILES[sport]
+    # Per-game logger so interleaved workers in one process stay readable
+    log = logging.getLogger(f"worker.{event_ticker}")
+    log.info(f"Initializing {sport.upper()} Worker | {away_team}@{home_team} | {game_id}")
 
     # 1. Load Configuration
-    config = _load_config()
+    config = _load_config(profile)
     trading_config = config.get("trading", {})
     mode_str = trading_config.get("mode", "dry_run").lower()
     is_dry_run = (mode_str != "live")
 
     # 2. Sleep Logic
-    tipoff_dt = _get_tipoff_from_job(game_date, event_ticker)
-    if tipoff_dt:
-        start_time = tipoff_dt - timedelta(minutes=PREGAME_MINUTES)
-        now = datetime.now(timezone.utc)
-        if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=timezone.utc)
-
-        sleep_secs = (start_time - now).total_seconds()
+    tipoff_ns = _get_tipoff_from_job(profile.jobs_dir, game_date, event_ticker)
+    if tipoff_ns:
+        sleep_secs = (tipoff_ns - time.time_ns()) / 1e9 - profile.pregame_minutes * 60
+        tipoff_dt = datetime.fromtimestamp(tipoff_ns / 1e9, timezone.utc)
+
         if sleep_secs > 0:
             log.info(f"Tipoff {tipoff_dt}. Sleeping {sleep_secs:.0f}s...")
             await asyncio.sleep(sleep_secs)
             log.info("Waking up!")
+        else:
+            log.info(
+                f"Tipoff {tipoff_dt} was in the past. Starting immediately.")
+    else:
+        log.warning("No valid tipoff time found. Starting immediately.")
+
+    # Heavy modules are imported only once the worker is done sleeping
+    from src.strategies.composite import CompositeStrategy
+    from src.strategies.registry import get_strategy_class
+    from src.core.trade_logger import TradeLogger
+    from src.engine.live_engine import LiveEngine
+    from src.engine.broker import KalshiBroker
+    from src.connectors.kalshi.http_client import KalshiHTTPClient
 
     # 3. Setup Clients & Broker
-    nba_client = NBAScoreboardClient()
-    kalshi_http = KalshiHTTPClient()
+    if kalshi_http is None:
+        kalshi_http = KalshiHTTPClient()
 
     if is_dry_run:
         log.info("Mode: DRY RUN")
@@ -124,8 +323,13 @@ async def run_worker(
     else:
         log.warning("Mode: LIVE REAL MONEY")
         broker = KalshiBroker(kalshi_http, dry_run=False)
+        # Done after the sleep: connections opened hours earlier would have
+        # been dropped as idle before the first order.
+        warm = await kalshi_http.prewarm()
+        log.info(f"Kalshi REST pool prewarmed ({warm} connections)")
 
-    trade_logger = TradeLogger(sport="nba", dry_run=is_dry_run)
+    # Trade logs are separated per sport
+    trade_logger = TradeLogger(sport=sport, dry_run=is_dry_run)
 
     # 4. Initialize Strategies from Config
     active_strats = []
@@ -150,79 +354,113 @@ async def run_worker(
     # Wrap in Composite
     composite_strategy = CompositeStrategy(active_strats)
     engine = LiveEngine(composite_strategy, broker)
-    state_writer = PredictEngineStateWriter(game_id)
+    state_writer = PredictEngineStateWriter(game_id, output_dir=profile.states_dir)
 
     # 5. Streams
-    target_dt = date.fromisoformat(game_date)
-    # Note: poll_game might finish if NBA says Final, but WS keeps going.
-    nba_stream = nba_client.poll_game(
-        game_id, poll_interval=2.0, stop_on_final=True, target_date=target_dt)
-    k_stream = ticker_stream(market_tickers)
-    merged_stream = merge_nba_and_kalshi_streams(
-        event_ticker=event_ticker, game_id=game_id, home_team=home_team, away_team=away_team,
-        tick_stream=k_stream, scoreboard_stream=nba_stream, initial_markets=market_tickers
-    )
+    merged_stream = _build_merged_stream(
+        profile, event_ticker=event_ticker, game_id=game_id, home_team=home_team,
+        away_team=away_team, market_tickers=market_tickers, game_date=game_date,
+        tipoff_ns=tipoff_ns or None)
 
     # 6. Loop
     state_count = 0
-    last_rest_check = time.time()
+    markets_done = asyncio.Event()
+    terminal_task = asyncio.create_task(_poll_markets_terminal(
+        kalshi_http, event_ticker, market_tickers, profile.terminal_statuses,
+        markets_done))
+    # Positions only change when an order goes through, so the view is
+    # rebuilt only after an execute instead of on every evaluated state.
+    portfolio_view = broker.get_portfolio_view()
+    portfolio_dirty = False
+
+    write_q: asyncio.Queue = asyncio.Queue(maxsize=STATE_QUEUE_MAXSIZE)
+    writer_task = asyncio.create_task(drain_state_queue(
+        write_q, state_writer,
+        batch_size=STATE_BATCH_SIZE, max_wait=STATE_BATCH_MAX_WAIT))
+
+    raw_key = profile.raw_context_key
 
     try:
         async for state in merged_stream:
             state_count += 1
-            state_writer.append_state(state)
+            _enqueue_state(write_q, state)
 
-            # Exit on NBA final
-            nba_status = state.get("context", {}).get(
-                "nba_raw", {}).get("status", "")
-            if "Final" in nba_status:
+            # Exit on league final ("Final", "Final/OT", ...)
+            ctx = state.get("context") or _EMPTY
+            game_status = (ctx.get(raw_key) or _EMPTY).get("status") or ""
+            if game_status.startswith("Final"):
                 log.info(
-                    f"NBA Game Status is '{nba_status}'. Game over. Exiting worker.")
+                    "Game Status is '%s'. Game over. Exiting worker.", game_status)
                 break
 
             # --- EXIT CHECK ---
-            # Every 60 seconds, ask REST API if we can go home.
-            if time.time() - last_rest_check > 60:
-                is_done = await _check_markets_terminal(kalshi_http, market_tickers)
-                if is_done:
-                    log.info(
-                        "Markets confirmed CLOSED/SETTLED via REST. Exiting worker.")
-                    break
-                last_rest_check = time.time()
+            # A background task asks the REST API every 60s if we can go home.
+            if markets_done.is_set():
+                log.info(
+                    "Markets confirmed CLOSED/SETTLED via REST. Exiting worker.")
+                break
             # ------------------
 
+            if state_count % profile.heartbeat_every == 0:
+                log.info("Heartbeat | Ticks: %d | Score: %s-%s", state_count,
+                         state.get('score_away'), state.get('score_home'))
+
             try:
-                portfolio_view = broker.get_portfolio_view()
+                if portfolio_dirty:
+                    portfolio_view = broker.get_portfolio_view()
+                    portfolio_dirty = False
                 intents = composite_strategy.on_state(state, portfolio_view)
 
+                # One at a time: execute() checks positions and balance before
+                # its awaited submit and records the fill after, so concurrent
+                # intents would all see the same pre-trade state (e.g. two
+                # closes selling one position twice).
                 for intent in intents:
-                    result = await broker.execute(intent, state)
-                    strat_name = getattr(intent, 'strategy_name', 'unknown')
+                    strat_name = intent.strategy_name
+                    try:
+                        result = await broker.execute(intent, state)
+                    except Exception as e:
+                        portfolio_dirty = True
+                        log.error("ORDER ERROR (%s): %s", strat_name, e,
+                                  exc_info=True)
+                        continue
                     trade_logger.log_order_attempt(
                         game_id, strat_name, intent, result)
 
                     if result.ok:
-                        log.info(
-                            f"ORDER FILLED ({strat_name}): {intent.market_id} {intent.action}")
+                        portfolio_dirty = True
+                        log.info("ORDER FILLED (%s): %s %s",
+                                 strat_name, intent.market_id, intent.action)
                     else:
-                        log.error(
-                            f"ORDER FAILED ({strat_name}): {result.error}")
+                        log.error("ORDER FAILED (%s): %s",
+                                  strat_name, result.error)
 
             except Exception as e:
-                log.error(f"Error in trading loop: {e}", exc_info=True)
-
-            if state_count % 100 == 0:
-                score = f"{state.get('score_away')}-{state.get('score_home')}"
-                log.info(f"Heartbeat | Ticks: {state_count} | Score: {score}")
+                log.error("Error in trading loop: %s", e, exc_info=True)
 
     except Exception as e:
         log.error(f"Worker crashed: {e}", exc_info=True)
     finally:
+        # Closing the merged stream stops its pump tasks and releases the
+        # ticker hub / scoreboard broadcaster subscriptions for this game.
+        with suppress(Exception):
+            await merged_stream.aclose()
+        terminal_task.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await terminal_task
+        if not writer_task.done():
+            await write_q.join()
+        writer_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await writer_task
         state_writer.flush()
+        trade_logger.close()
         log.info(f"Worker finished. Total states: {state_writer.count}")
 
-if __name__ == "__main__":
+
+def main() -> None:
     p = argparse.ArgumentParser()
+    p.add_argument("--sport", choices=sorted(SPORT_PROFILES), default="nba")
     p.add_argument("--event-ticker", required=True)
     p.add_argument("--game-id", required=True)
     p.add_argument("--home", required=True)
@@ -233,11 +471,25 @@ if __name__ == "__main__":
     args = p.parse_args()
     market_list = args.markets.split(",")
 
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"[%(asctime)s][%(levelname)s][{args.sport.upper()}-Worker][%(message)s]",
+        datefmt="%H:%M:%S"
+    )
+
+    # uvloop gives a cheaper event loop where available (not on Windows)
+    install_uvloop()
+
     asyncio.run(run_worker(
         event_ticker=args.event_ticker,
         game_id=args.game_id,
         home_team=args.home,
         away_team=args.away,
         market_tickers=market_list,
-        game_date=args.date
+        game_date=args.date,
+        sport=args.sport,
     ))
+
+
+if __name__ == "__main__":
+    main()
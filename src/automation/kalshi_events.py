@@ -0,0 +1,54 @@
+# src/automation/kalshi_events.py
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+log = logging.getLogger(__name__)
+
+KALSHI_BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
+
+# Shared keep-alive session so repeated Kalshi calls reuse the TLS connection
+_SESSION = requests.Session()
+# Transient Kalshi errors (rate limit, 5xx) are retried with backoff
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504))))
+
+
+def open_events_url(series_ticker: str) -> str:
+    """
+    Fully-qualified URL for a series' open events with nested markets.
+    Callers build it once at import; the query string never changes.
+    """
+    return f"{KALSHI_BASE_URL}/events?" + urlencode({
+        "series_ticker": series_ticker,
+        "with_nested_markets": "true",
+        "status": "open",
+        "limit": 200,
+    })
+
+
+def fetch_events(url: str) -> List[Dict[str, Any]]:
+    """
+    GET a prebuilt events URL. Returns [] on any failure.
+    """
+    try:
+        resp = _SESSION.get(url, timeout=10)
+        resp.raise_for_status()
+        data = resp.json()
+    except (requests.RequestException, ValueError) as e:  # ValueError: bad JSON
+        log.error(f"Failed to fetch Kalshi events: {e}")
+        return []
+
+    if isinstance(data, dict):
+        return data.get("events", []) or []
+    if isinstance(data, list):
+        return data
+    return []
@@ -1,130 +1,222 @@
 # src/automation/manager.py
 from __future__ import annotations
-from src.automation.nfl.discover_games import _save_jobs as save_nfl_jobs
-from src.automation.nfl.discover_games import discover_jobs_for_date as discover_nfl
-from src.automation.discover_games import _save_jobs as save_nba_jobs
-from src.automation.discover_games import discover_jobs_for_date as discover_nba
+from src.automation import discover_games as nba_discovery
+from src.automation.nfl import discover_games as nfl_discovery
+from src.core.aio import install_uvloop
 
 import argparse
-import subprocess
-import sys
+import asyncio
+import importlib
+import os
+import random
 import time
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime
-from pathlib import Path
+from typing import Any, Callable, Dict, List
 from zoneinfo import ZoneInfo
 
-# Fix path
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-# NBA Imports
-
-# NFL Imports
-
 logging.basicConfig(
     level=logging.INFO,
-    format="[%(asctime)s][Manager][%(message)s]",
+    format="[%(asctime)s][%(name)s][%(message)s]",
     datefmt="%H:%M:%S"
 )
 log = logging.getLogger("manager")
 
 
-def spawn_worker(sport: str, job: Any, dry_run: bool) -> subprocess.Popen:
+@dataclass(frozen=True)
+class SportCfg:
+    """
+    How the manager discovers and saves one sport's jobs.
+    """
+    label: str
+    discover: Callable[[date], List[Any]]
+    save: Callable[[List[Any], date], None]
+
+
+# Run in this order each cycle; keys are game_worker SPORT_PROFILES keys
+SPORTS: Dict[str, SportCfg] = {
+    "nba": SportCfg("NBA", nba_discovery.discover_jobs_for_date, nba_discovery._save_jobs),
+    "nfl": SportCfg("NFL", nfl_discovery.discover_jobs_for_date, nfl_discovery._save_jobs),
+}
+
+
+# Launch pacing: no pause while the box is idle, exponential backoff
+# (with jitter) once the 1-minute load average per CPU gets high.
+STAGGER_BASE_SECS = 0.5
+STAGGER_MAX_SECS = 10.0
+STAGGER_LOAD_THRESHOLD = 0.7
+STAGGER_WINDOW_SECS = 60.0
+
+
+def _compute_stagger_delay(recent_starts: deque) -> float:
     """
-    Spawns a background worker process for a specific job.
+    Seconds to wait before launching the next worker. `recent_starts` holds
+    monotonic launch times; entries older than STAGGER_WINDOW_SECS are dropped.
     """
-    markets_str = ",".join(job.market_tickers)
+    now = time.monotonic()
+    while recent_starts and now - recent_starts[0] > STAGGER_WINDOW_SECS:
+        recent_starts.popleft()
 
-    # Determine which worker script to run
-    if sport == "nba":
-        module_path = "src.automation.game_worker"
-    elif sport == "nfl":
-        module_path = "src.automation.nfl.game_worker"
+    try:
+        load_per_cpu = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:  # getloadavg is unavailable (e.g. Windows)
+        load_per_cpu = 0.0
+
+    if load_per_cpu <= STAGGER_LOAD_THRESHOLD:
+        delay = 0.0
     else:
-        raise ValueError(f"Unknown sport: {sport}")
+        exp = min(len(recent_starts), 5)
+        delay = min(STAGGER_BASE_SECS * 2 ** exp, STAGGER_MAX_SECS)
+        delay *= random.uniform(0.5, 1.0)
+
+    log.info(
+        f"Stagger: load/cpu={load_per_cpu:.2f}, "
+        f"launches/{STAGGER_WINDOW_SECS:.0f}s={len(recent_starts)} -> {delay:.2f}s")
+    return delay
+
+
+# Modules run_worker imports lazily after its pregame sleep. Loading them once
+# up front keeps the first worker to wake from blocking the shared event loop
+# (and every other game on it) on imports.
+WORKER_PRELOAD_MODULES = (
+    "src.strategies.composite",
+    "src.strategies.registry",
+    "src.core.trade_logger",
+    "src.engine.live_engine",
+    "src.engine.broker",
+    "src.connectors.kalshi.http_client",
+    "src.connectors.kalshi.ticker_stream",
+    "src.connectors.kalshi.nba_state_merger",
+    "src.connectors.kalshi.nfl_state_merger",
+    "src.connectors.nba.scoreboard_client",
+    "src.connectors.nfl.scoreboard_client",
+)
 
-    cmd = [
-        sys.executable, "-m", module_path,
-        "--event-ticker", job.event_ticker,
-        "--game-id", job.game_id,
-        "--home", job.home_team,
-        "--away", job.away_team,
-        "--date", job.game_date,
-        "--markets", markets_str
-    ]
 
-    # Note: Workers read config.json for mode, but we keep the structure clean.
+def _preload_worker_modules() -> None:
+    for name in WORKER_PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            log.warning(f"Preload of {name} failed: {e}")
 
-    # Redirect stdout/stderr to systemd journal (inherit)
-    return subprocess.Popen(cmd, cwd=str(PROJECT_ROOT))
 
+def _worker_kwargs(sport: str, job: Any) -> dict:
+    """
+    run_worker() arguments for a discovered job.
+    """
+    # One worker coroutine serves every sport; `sport` selects its profile
+    if sport not in SPORTS:
+        raise ValueError(f"Unknown sport: {sport}")
 
-def run_daily_cycle(target_date: date, dry_run: bool):
-    log.info(f"--- Starting Daily Cycle for {target_date} ---")
+    return dict(
+        sport=sport,
+        event_ticker=job.event_ticker,
+        game_id=job.game_id,
+        home_team=job.home_team,
+        away_team=job.away_team,
+        game_date=job.game_date,
+        market_tickers=list(job.market_tickers),
+    )
+
+
+def _on_worker_done(task: asyncio.Task) -> None:
+    if task.cancelled():
+        log.warning(f"Worker {task.get_name()} cancelled")
+    elif task.exception() is not None:
+        log.error(f"Worker {task.get_name()} failed: {task.exception()!r}")
+    else:
+        log.info(f"Worker {task.get_name()} finished")
 
-    all_processes = []
 
-    # -----------------------------
-    # 1. NBA Cycle
-    # -----------------------------
+async def _run_workers(all_jobs: list) -> None:
+    """
+    Runs every job as a task in this process. Workers mostly wait on HTTP and
+    websockets, so one event loop carries a whole slate and all of them share
+    a single Kalshi REST session.
+    """
+    # Imported here so discovery does not pay for the trading stack
+    from src.automation.game_worker import run_worker
+    from src.connectors.kalshi.http_client import KalshiHTTPClient
+
+    kalshi_http = KalshiHTTPClient()
+
+    tasks = []
+    recent_starts: deque = deque()
     try:
-        log.info("Running NBA Discovery...")
-        nba_jobs = discover_nba(target_date)
-        save_nba_jobs(nba_jobs, target_date)
-
-        if nba_jobs:
-            log.info(f"Spawning {len(nba_jobs)} NBA workers...")
-            for job in nba_jobs:
-                p = spawn_worker("nba", job, dry_run)
-                all_processes.append(("NBA", job.event_ticker, p))
-                time.sleep(0.5)  # Stagger start
+        for sport, job in all_jobs:
+            if tasks:
+                delay = _compute_stagger_delay(recent_starts)
+                if delay:
+                    await asyncio.sleep(delay)
+            task = asyncio.create_task(
+                run_worker(**_worker_kwargs(sport, job), kalshi_http=kalshi_http),
+                name=f"{sport}:{job.event_ticker}")
+            task.add_done_callback(_on_worker_done)
+            tasks.append(task)
+            recent_starts.append(time.monotonic())
+
+        log.info(f"Monitoring {len(tasks)} active workers...")
+
+        # Done-callbacks report each worker the moment it exits; gather() only
+        # waits for the last one.
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        kalshi_http.close()
+
+
+def _discover_sport(cfg: SportCfg, target_date: date) -> List[Any]:
+    """
+    Discovers and saves one sport's jobs. Failures are logged, never raised.
+    """
+    try:
+        log.info(f"Running {cfg.label} Discovery...")
+        jobs = cfg.discover(target_date)
+        cfg.save(jobs, target_date)
+
+        if jobs:
+            log.info(f"Queueing {len(jobs)} {cfg.label} workers...")
         else:
-            log.info("No NBA games found.")
+            log.info(f"No {cfg.label} games found.")
+        return jobs
 
     except Exception as e:
-        log.error(f"NBA Cycle Failed: {e}", exc_info=True)
+        log.error(f"{cfg.label} Cycle Failed: {e}", exc_info=True)
+        return []
+
+
+def run_daily_cycle(target_date: date, dry_run: bool):
+    log.info(f"--- Starting Daily Cycle for {target_date} ---")
+
+    all_jobs = []
 
     # -----------------------------
-    # 2. NFL Cycle
+    # 1. Discovery, all sports in parallel
     # -----------------------------
-    try:
-        log.info("Running NFL Discovery...")
-        nfl_jobs = discover_nfl(target_date)
-        save_nfl_jobs(nfl_jobs, target_date)
-
-        if nfl_jobs:
-            log.info(f"Spawning {len(nfl_jobs)} NFL workers...")
-            for job in nfl_jobs:
-                p = spawn_worker("nfl", job, dry_run)
-                all_processes.append(("NFL", job.event_ticker, p))
-                time.sleep(0.5)
-        else:
-            log.info("No NFL games found.")
-
-    except Exception as e:
-        log.error(f"NFL Cycle Failed: {e}", exc_info=True)
+    # Each sport's discovery is network-bound, so the cycle waits for the
+    # slowest sport rather than the sum. Jobs keep SPORTS order.
+    with ThreadPoolExecutor(max_workers=len(SPORTS)) as pool:
+        futures = [(sport, pool.submit(_discover_sport, cfg, target_date))
+                   for sport, cfg in SPORTS.items()]
+        for sport, fut in futures:
+            all_jobs.extend((sport, job) for job in fut.result())
 
     # -----------------------------
-    # 3. Monitor All
+    # 2. Run All
     # -----------------------------
-    if not all_processes:
+    if not all_jobs:
         log.info("No workers spawned. Exiting.")
         return
 
-    log.info(f"Monitoring {len(all_processes)} active workers...")
-
-    active = all_processes[:]
-    while active:
-        for item in active[:]:
-            sport, ticker, p = item
-            ret = p.poll()
-            if ret is not None:
-                log.info(
-                    f"[{sport}] Worker {ticker} finished (Exit Code: {ret})")
-                active.remove(item)
-        time.sleep(5)
+    _preload_worker_modules()
+
+    # uvloop gives a cheaper event loop where available (not on Windows)
+    install_uvloop()
+
+    asyncio.run(_run_workers(all_jobs))
 
     log.info("--- All workers finished. Cycle Complete. ---")
 
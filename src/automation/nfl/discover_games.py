@@ -2,20 +2,24 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
-from dataclasses import asdict, dataclass
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
 from zoneinfo import ZoneInfo
 
 from src.connectors.nfl.scoreboard_client import NFLScoreboardClient
+from src.automation.kalshi_events import fetch_events, open_events_url
+from src.core.jsonio import write_json
+from src.core.timeutil import to_epoch_ns
 
-KALSHI_BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 SERIES_TICKER = "KXNFLGAME"
+_EVENTS_URL = open_events_url(SERIES_TICKER)
+
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 JOBS_DIR = PROJECT_ROOT / "src" / "storage" / "jobs" / "nfl"
 
@@ -38,7 +42,11 @@ ESPN_TO_KALSHI = {
 }
 
 
-@dataclass
+# KXNFLGAME-25DEC07TENCLE -> "TENCLE" (away then home; codes are 2-3 letters)
+_EVENT_TEAMS_RE = re.compile(r"^[^-]+-\d{2}[A-Z]{3}\d{2}([A-Z]+)")
+
+
+@dataclass(frozen=True, slots=True)
 class NFLJob:
     game_date: str
     game_id: str
@@ -46,40 +54,47 @@ class NFLJob:
     away_team: str
     tipoff_utc: Optional[str]
     event_ticker: str
-    market_tickers: List[str]
+    market_tickers: Tuple[str, ...]
+    tipoff_epoch_ns: Optional[int] = None
 
 
 def _fetch_kalshi_events() -> List[Dict[str, Any]]:
-    url = f"{KALSHI_BASE_URL}/events"
-    params = {"series_ticker": SERIES_TICKER,
-              "with_nested_markets": "true", "status": "open", "limit": 200}
-    try:
-        resp = requests.get(url, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("events", []) if isinstance(data, dict) else (data if isinstance(data, list) else [])
-    except Exception as e:
-        log.error(f"Failed to fetch Kalshi events: {e}")
-        return []
+    return fetch_events(_EVENTS_URL)
 
 
 def _extract_winner_markets(event: Dict[str, Any]) -> List[str]:
-    markets = event.get("markets") or []
-    tickers = []
-    for m in markets:
-        if m.get("market_type") == "binary" and "winner" in (m.get("title") or "").lower():
-            if t := m.get("ticker"):
-                tickers.append(t)
-    return tickers
+    return [
+        t for m in event.get("markets") or ()
+        if m.get("market_type") == "binary"
+        and "winner" in (m.get("title") or "").lower()
+        and (t := m.get("ticker"))
+    ]
+
+
+def _index_events_by_teams(k_events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    {team-code suffix of the event ticker: event}, built once so every game
+    is an exact dict lookup instead of substring scans over all events.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for ke in k_events:
+        m = _EVENT_TEAMS_RE.match(ke.get("event_ticker") or "")
+        if m:
+            index.setdefault(m.group(1), ke)
+    return index
 
 
 def discover_jobs_for_date(target_date: date) -> List[NFLJob]:
     log.info(f"Discovering NFL jobs for {target_date}")
 
     client = NFLScoreboardClient()
-    games = client.fetch_schedule(target_date)
-    k_events = _fetch_kalshi_events()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        games_future = pool.submit(client.fetch_schedule, target_date)
+        events_future = pool.submit(_fetch_kalshi_events)
+        games = games_future.result()
+        k_events = events_future.result()
 
+    events_by_teams = _index_events_by_teams(k_events)
     jobs = []
 
     for g in games:
@@ -90,18 +105,10 @@ def discover_jobs_for_date(target_date: date) -> List[NFLJob]:
         home_kalshi = ESPN_TO_KALSHI.get(home_espn, home_espn)
         away_kalshi = ESPN_TO_KALSHI.get(away_espn, away_espn)
 
-        matched_event = None
-        for ke in k_events:
-            et = ke.get("event_ticker", "")
-            if not et:
-                continue
-
-            # Robust Check: Look for the team codes in the ticker string
-            # Kalshi tickers are like KXNFLGAME-25DEC07TENCLE
-            # We check if BOTH normalized abbreviations exist in the ticker string.
-            if home_kalshi in et and away_kalshi in et:
-                matched_event = ke
-                break
+        # Exact match on the ticker's team suffix, e.g. KXNFLGAME-25DEC07TENCLE.
+        # Exact codes avoid partial hits like "NY" inside "NYG".
+        matched_event = (events_by_teams.get(away_kalshi + home_kalshi)
+                         or events_by_teams.get(home_kalshi + away_kalshi))
 
         if not matched_event:
             log.warning(
@@ -119,7 +126,8 @@ def discover_jobs_for_date(target_date: date) -> List[NFLJob]:
             away_team=away_espn,
             tipoff_utc=g["tipoff_utc"],
             event_ticker=matched_event["event_ticker"],
-            market_tickers=market_tickers
+            market_tickers=tuple(market_tickers),
+            tipoff_epoch_ns=to_epoch_ns(g["tipoff_utc"]),
         )
         jobs.append(job)
 
@@ -130,8 +138,7 @@ def discover_jobs_for_date(target_date: date) -> List[NFLJob]:
 def _save_jobs(jobs: List[NFLJob], target_date: date):
     JOBS_DIR.mkdir(parents=True, exist_ok=True)
     filename = JOBS_DIR / f"jobs_{target_date.isoformat()}.json"
-    with open(filename, "w") as f:
-        json.dump([asdict(j) for j in jobs], f, indent=2)
+    write_json(filename, jobs, indent=True)
     log.info(f"Saved jobs to {filename}")
 
 
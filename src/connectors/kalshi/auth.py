@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import base64
+import functools
 import os
 import time
 from pathlib import Path
 from typing import Dict
 
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from dotenv import load_dotenv
 
 # ---------------------------------------------------------------------------
@@ -23,6 +24,13 @@ WS_URL = "wss://api.elections.kalshi.com/trade-api/ws/v2"
 _API_KEY_ID = os.getenv("KALSHI_API_KEY_ID")
 _PRIVATE_KEY = None
 
+# Signing inputs that never change, built once
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.DIGEST_LENGTH,
+)
+_WS_SIGN_SUFFIX = b"GET/trade-api/ws/v2"
+
 
 def _load_private_key():
     global _PRIVATE_KEY
@@ -32,23 +40,22 @@ def _load_private_key():
             raise RuntimeError(
                 f"kalshi_private_key.pem not found at {key_path}")
         with key_path.open("rb") as f:
-            _PRIVATE_KEY = serialization.load_pem_private_key(
+            key = serialization.load_pem_private_key(
                 f.read(),
                 password=None,
             )
+        # Kalshi API keys are RSA and only RSA-PSS signatures are accepted;
+        # an EC/Ed25519 PEM would otherwise fail obscurely at first sign().
+        if not isinstance(key, rsa.RSAPrivateKey):
+            raise RuntimeError(
+                f"{key_path.name} must hold an RSA private key, got {type(key).__name__}")
+        _PRIVATE_KEY = key
     return _PRIVATE_KEY
 
 
 def _sign_pss(message: bytes) -> str:
     private_key = _load_private_key()
-    signature = private_key.sign(
-        message,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()),
-            salt_length=padding.PSS.DIGEST_LENGTH,
-        ),
-        hashes.SHA256(),
-    )
+    signature = private_key.sign(message, _PSS_PADDING, hashes.SHA256())
     return base64.b64encode(signature).decode("utf-8")
 
 
@@ -56,6 +63,13 @@ def _sign_pss(message: bytes) -> str:
 # REST auth headers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=256)
+def _sign_suffix(method: str, route: str) -> bytes:
+    # Signed message is timestamp + METHOD + /trade-api/v2<route>; only the
+    # timestamp changes between calls to the same endpoint.
+    return f"{method.upper()}/trade-api/v2{route}".encode("utf-8")
+
+
 def build_auth_headers(
     method: str,
     route: str,
@@ -74,18 +88,15 @@ def build_auth_headers(
         raise ValueError("route must start with '/'")
 
     if timestamp_ms is None:
-        timestamp_ms = int(time.time() * 1000)
-
-    method_up = method.upper()
-    path_for_sig = "/trade-api/v2" + route  # what gets signed
+        timestamp_ms = time.time_ns() // 1_000_000
 
-    msg = f"{timestamp_ms}{method_up}{path_for_sig}".encode("utf-8")
-    sig = _sign_pss(msg)
+    ts = str(timestamp_ms)
+    sig = _sign_pss(ts.encode("ascii") + _sign_suffix(method, route))
 
     return {
         "KALSHI-ACCESS-KEY": _API_KEY_ID,
         "KALSHI-ACCESS-SIGNATURE": sig,
-        "KALSHI-ACCESS-TIMESTAMP": str(timestamp_ms),
+        "KALSHI-ACCESS-TIMESTAMP": ts,
         "Content-Type": "application/json",
     }
 
@@ -101,12 +112,11 @@ def build_ws_headers() -> Dict[str, str]:
     if not _API_KEY_ID:
         raise RuntimeError("KALSHI_API_KEY_ID missing in environment")
 
-    timestamp_ms = int(time.time() * 1000)
-    msg_string = f"{timestamp_ms}GET/trade-api/ws/v2"
-    sig = _sign_pss(msg_string.encode("utf-8"))
+    ts = str(time.time_ns() // 1_000_000)
+    sig = _sign_pss(ts.encode("ascii") + _WS_SIGN_SUFFIX)
 
     return {
         "KALSHI-ACCESS-KEY": _API_KEY_ID,
         "KALSHI-ACCESS-SIGNATURE": sig,
-        "KALSHI-ACCESS-TIMESTAMP": str(timestamp_ms),
+        "KALSHI-ACCESS-TIMESTAMP": ts,
     }
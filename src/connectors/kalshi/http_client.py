@@ -1,21 +1,91 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.core.jsonio import JSONDecodeError, dumps, loads
 
 from .auth import API_BASE, build_auth_headers
 
+# Keep-alive connections to the Kalshi host. The manager shares one client
+# across every game; each worker sends its calls through run() one at a time,
+# but calls from different games overlap and each in-flight call holds a
+# connection, so size for a slate rather than reconnecting when the pool
+# overflows.
+POOL_MAXSIZE = 16
+
+# Connections a live worker opens with prewarm() once its pre-tipoff sleep
+# ends. A worker executes its orders one at a time, so it needs only a couple.
+PREWARM_CONNECTIONS = 2
+
+T = TypeVar("T")
+
 
 class KalshiHTTPClient:
     """
     Thin, low-level REST client for Kalshi.
-    Synchronous methods; caller should wrap in asyncio.to_thread if needed.
+    Synchronous methods; async callers await them through run().
     """
 
-    def __init__(self, *, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        *,
+        timeout: float = 10.0,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         self.timeout = timeout
-        self._session = requests.Session()
+        # Callers may pass a shared session so connections are reused across clients
+        owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=1, pool_maxsize=POOL_MAXSIZE))
+        self._session = session
+        self._owns_session = owns_session
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """
+        Awaits a blocking client call (signing + HTTP) on this client's own
+        threads. Order posts never queue behind scoreboard polls or file
+        writes in the loop's default executor.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=POOL_MAXSIZE, thread_name_prefix="kalshi-http")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """
+        Stops this client's threads and closes its pooled connections (a
+        session passed in by the caller is left open). Call once all callers
+        are done.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._owns_session:
+            self._session.close()
+
+    async def prewarm(self, n: int = PREWARM_CONNECTIONS) -> int:
+        """
+        Opens up to n keep-alive connections with concurrent balance reads so
+        the first orders skip the TCP/TLS handshake. Returns how many succeeded;
+        failures are ignored (the pool just starts colder).
+        """
+        n = min(n, POOL_MAXSIZE)
+        results = await asyncio.gather(
+            *(self.run(self.get_balance) for _ in range(n)),
+            return_exceptions=True,
+        )
+        return sum(1 for r in results if not isinstance(r, BaseException))
 
     # ------------------------------------------------------------------ #
     # Core request helper
@@ -35,12 +105,14 @@ class KalshiHTTPClient:
         url = API_BASE + route
         headers = build_auth_headers(method, route)
 
+        # Bodies are (de)serialized with orjson; auth headers already carry
+        # Content-Type: application/json.
         resp = self._session.request(
             method=method.upper(),
             url=url,
             headers=headers,
             params=params,
-            json=json_body,
+            data=dumps(json_body) if json_body is not None else None,
             timeout=self.timeout,
         )
         resp.raise_for_status()
@@ -48,8 +120,8 @@ class KalshiHTTPClient:
         if not resp.content:
             return {}
         try:
-            return resp.json()
-        except Exception:
+            return loads(resp.content)
+        except JSONDecodeError:
             return {"raw": resp.text}
 
     # ------------------------------------------------------------------ #
@@ -61,6 +133,12 @@ class KalshiHTTPClient:
         route = f"/markets/{ticker}"
         return self._request("GET", route)
 
+    def get_event(self, event_ticker: str, *, with_nested_markets: bool = True) -> Dict[str, Any]:
+        """GET /events/{event_ticker} (markets nested under event["markets"])"""
+        route = f"/events/{event_ticker}"
+        params = {"with_nested_markets": "true"} if with_nested_markets else None
+        return self._request("GET", route, params=params)
+
     def get_balance(self) -> Dict[str, Any]:
         """
         GET /portfolio/balance
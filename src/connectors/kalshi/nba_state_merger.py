@@ -2,21 +2,47 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Dict, Iterable, Optional, List
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
 
 from src.core.nba_models import (
+    NBAGameState,
     NBAMoneylineMarket,
     NBAScoreboardSnapshot,
+    build_nba_state_base,
     build_nba_state_dict,
 )
 
 
-@dataclass
+# Pre-score ticks kept for replay. Each ticker message carries every price
+# field, so the newest few per market rebuild the same market state.
+WARMUP_TICKS_MAX = 256
+
+# Fan-in backlog bound (~1s of a peak tick burst). When full, the producers
+# wait for room instead of the backlog growing without limit. That does not
+# reach Kalshi: the shared ticker hub keeps reading the socket for every game
+# and drops (and logs) this game's oldest ticks once its own queue is full.
+EVENTS_QUEUE_MAX = 4096
+
+
+def _safe_float(v: Any) -> Optional[float]:
+    # ticker_stream already hands us float | None for prices; only other
+    # types (ints, strings) need the conversion.
+    if v is None or type(v) is float:
+        return v
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+# Built once per WS tick on the hot path: slots skip the per-instance __dict__
+@dataclass(slots=True, frozen=True)
 class KalshiTick:
-    ts_iso: datetime
+    ts_iso: str             # ISO-8601, passed through as received
     market_ticker: str
     price_prob: Optional[float] = None
     yes_bid_prob: Optional[float] = None
@@ -27,22 +53,13 @@ class KalshiTick:
 
     @classmethod
     def from_raw(cls, raw: Dict[str, Any]) -> "KalshiTick":
+        # ticker_stream already formats ts_iso; keeping the string avoids a
+        # fromisoformat() + isoformat() round-trip on every tick.
         ts_raw = raw.get("ts_iso")
-        if isinstance(ts_raw, str):
-            try:
-                ts = datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
-            except ValueError:
-                ts = datetime.now(timezone.utc)
+        if isinstance(ts_raw, str) and ts_raw:
+            ts = ts_raw[:-1] + "+00:00" if ts_raw.endswith("Z") else ts_raw
         else:
-            ts = datetime.now(timezone.utc)
-
-        def _safe_float(v: Any) -> Optional[float]:
-            if v is None:
-                return None
-            try:
-                return float(v)
-            except:
-                return None
+            ts = datetime.now(timezone.utc).isoformat()
 
         return cls(
             ts_iso=ts,
@@ -73,137 +90,180 @@ async def merge_nba_and_kalshi_streams(
 
     # 1. Internal State
     latest_score: Optional[NBAScoreboardSnapshot] = None
+    state_base: Optional[NBAGameState] = None
     markets: Dict[str, NBAMoneylineMarket] = {}
 
+    # Market ticker suffix -> side ("...-LAL" is the LAL market). Resolved once
+    # when a market is created instead of re-splitting the ticker on every tick.
+    team_sides = {home_team: (home_team, "home"), away_team: (away_team, "away")}
+    no_side = (None, "unknown")
+
+    def _team_side(mt: str) -> tuple[Optional[str], str]:
+        return team_sides.get(mt.rpartition("-")[2], no_side)
+
+    def _apply_tick(raw: Dict[str, Any]) -> Optional[KalshiTick]:
+        """Upserts one raw tick into `markets`; None if it names no market."""
+        tick = KalshiTick.from_raw(raw)
+        mt = tick.market_ticker
+        if not mt:
+            return None
+
+        m = markets.get(mt)
+        if not m:
+            # Should have been seeded, but create if new
+            team, side = _team_side(mt)
+            m = NBAMoneylineMarket(
+                market_id=mt, event_ticker=event_ticker, type="moneyline",
+                team=team, side=side
+            )
+            markets[mt] = m
+
+        # Apply updates
+        if tick.price_prob is not None:
+            m["price"] = tick.price_prob
+        if tick.yes_bid_prob is not None:
+            m["yes_bid_prob"] = tick.yes_bid_prob
+        if tick.yes_ask_prob is not None:
+            m["yes_ask_prob"] = tick.yes_ask_prob
+        if tick.volume is not None:
+            m["volume"] = tick.volume
+        if tick.open_interest is not None:
+            m["open_interest"] = tick.open_interest
+        if tick.status is not None:
+            m["status"] = tick.status
+        return tick
+
     # Seed markets
     if initial_markets:
         for mt in initial_markets:
             mt_str = str(mt)
+            team, side = _team_side(mt_str)
             markets[mt_str] = NBAMoneylineMarket(
                 market_id=mt_str, event_ticker=event_ticker, type="moneyline",
                 price=None, yes_bid_prob=None, yes_ask_prob=None, volume=None,
-                open_interest=None, status=None, meta={}, team=None, side="unknown", line=None
+                open_interest=None, status=None, meta={}, team=team, side=side, line=None
             )
 
-    # 2. Queues for async decoupling
-    tick_queue = asyncio.Queue()
-    score_queue = asyncio.Queue()
-
-    # 3. Background Consumers
-    async def _consume_ticks():
-        async for t in tick_stream:
-            await tick_queue.put(t)
-        await tick_queue.put(None)  # Sentinel
+    # 2. One fan-in deque: both producers append (kind, item), item None =
+    # stream ended. Single consumer, so plain deque + Events replace
+    # asyncio.Queue and its per-put/get waiter bookkeeping.
+    events: deque = deque()
+    ready = asyncio.Event()   # set when events has something to drain
+    room = asyncio.Event()    # cleared while producers wait on a full backlog
+    room.set()
 
-    async def _consume_scores():
-        async for s in scoreboard_stream:
-            await score_queue.put(s)
-            if s.status.upper().startswith("FINAL"):
-                pass
-        await score_queue.put(None)
+    # 3. Background Producers
+    async def _pump(kind: str, stream: AsyncIterator[Any]):
+        try:
+            async for item in stream:
+                while len(events) >= EVENTS_QUEUE_MAX:
+                    room.clear()
+                    await room.wait()
+                events.append((kind, item))
+                ready.set()
+            events.append((kind, None))  # Sentinel
+            ready.set()
+        finally:
+            # A pump cancelled while parked on room.wait() must still close its
+            # source so hub / broadcaster subscriptions are released.
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
 
     # Launch tasks
-    t_task = asyncio.create_task(_consume_ticks())
-    s_task = asyncio.create_task(_consume_scores())
+    t_task = asyncio.create_task(_pump("tick", tick_stream))
+    s_task = asyncio.create_task(_pump("score", scoreboard_stream))
 
     # 4. Main Event Loop (Clock-Driven)
-    # We wake up every 0.1s to check queues, but we FORCE an emission if 1.0s passes
+    # Sleep until an event arrives, but FORCE an emission if 1.0s passes
 
-    last_emit = datetime.now(timezone.utc)
-    keep_running = True
+    # Heartbeat timing uses the loop's monotonic clock; wall-clock datetimes
+    # are only built for the timestamp of a heartbeat emission.
+    loop = asyncio.get_running_loop()
+    last_emit = loop.time()
 
     # Flags to track if streams are alive
     ticks_alive = True
     scores_alive = True
+    # state_base is rebuilt lazily, once per burst of score updates
+    base_stale = False
+    # Raw ticks received before the first score; only the newest are kept
+    warmup_ticks: deque = deque(maxlen=WARMUP_TICKS_MAX)
+
+    # One pending ready.wait() is kept across heartbeat timeouts instead of
+    # starting a new waiter every iteration.
+    wake_task: Optional[asyncio.Task] = None
+
+    try:
+        while ticks_alive or scores_alive:
+            if not events:
+                if wake_task is None:
+                    ready.clear()
+                    wake_task = asyncio.ensure_future(ready.wait())
+                timeout = None
+                if latest_score:
+                    timeout = max(0.0, 1.0 - (loop.time() - last_emit))
+                await asyncio.wait((wake_task,), timeout=timeout)
+                if wake_task.done():
+                    wake_task = None
+
+            # A. Drain everything that arrived, in arrival order.
+            # Scores only replace latest_score; price ticks are all applied, then
+            # the burst is emitted once, stamped with its newest tick.
+            newest_ts: Optional[str] = None
+            while events:
+                kind, item = events.popleft()
+                if kind == "score":
+                    if item is None:
+                        scores_alive = False
+                    else:
+                        latest_score = item
+                        base_stale = True
+                        while warmup_ticks:
+                            _apply_tick(warmup_ticks.popleft())
+                    continue
+
+                if item is None:
+                    ticks_alive = False
+                    continue
+
+                if latest_score is None:
+                    # Warmup: nothing is emitted before the first scoreboard snapshot,
+                    # so park raw ticks unparsed and replay them when it lands.
+                    warmup_ticks.append(item)
+                    continue
+
+                # B. Update Market State
+                tick = _apply_tick(item)
+                if tick is not None:
+                    newest_ts = tick.ts_iso
+            room.set()  # backlog is empty; release any producer waiting for room
+
+            # Emit on price change (Event-Driven aspect), once per drained burst
+            if newest_ts is not None and latest_score:
+                if base_stale:
+                    state_base = build_nba_state_base(latest_score, event_ticker=event_ticker)
+                    base_stale = False
+                yield build_nba_state_dict(latest_score, markets, event_ticker=event_ticker, ts_iso=newest_ts, base=state_base)
+                last_emit = loop.time()
 
-    while keep_running:
-        # If both streams are dead, we exit
-        if not ticks_alive and not scores_alive:
-            break
-
-        did_update = False
-
-        # A. Drain Score Updates (Take latest only)
-        # We only care about the MOST RECENT score update that arrived since last loop
-        new_score = None
-        while not score_queue.empty():
-            item = score_queue.get_nowait()
-            if item is None:
-                scores_alive = False
-            else:
-                new_score = item
-
-        if new_score:
-            latest_score = new_score
-            did_update = True
-
-        # B. Process Ticks (Process ALL to catch every price change)
-        # Unlike scores, we don't skip price ticks.
-        # But to avoid stalling, we fetch a batch.
-        while not tick_queue.empty():
-            raw_tick = tick_queue.get_nowait()
-            if raw_tick is None:
-                ticks_alive = False
-                continue
-
-            # Update Market State
-            tick = KalshiTick.from_raw(raw_tick)
-            mt = tick.market_ticker
-            if not mt:
-                continue
-
-            m = markets.get(mt)
-            if not m:
-                # Should have been seeded, but create if new
-                m = NBAMoneylineMarket(
-                    market_id=mt, event_ticker=event_ticker, type="moneyline",
-                    team=None, side="unknown"
-                )
-                markets[mt] = m
-
-            # Apply updates
-            if tick.price_prob is not None:
-                m["price"] = tick.price_prob
-            if tick.yes_bid_prob is not None:
-                m["yes_bid_prob"] = tick.yes_bid_prob
-            if tick.yes_ask_prob is not None:
-                m["yes_ask_prob"] = tick.yes_ask_prob
-            if tick.volume is not None:
-                m["volume"] = tick.volume
-            if tick.open_interest is not None:
-                m["open_interest"] = tick.open_interest
-            if tick.status is not None:
-                m["status"] = tick.status
-
-            # Infer side
-            if m.get("team") is None and "-" in mt:
-                suffix = mt.split("-")[-1]
-                if suffix in (home_team, away_team):
-                    m["team"] = suffix
-                    m["side"] = "home" if suffix == home_team else "away"
-
-            # Emit IMMEDIATELY on price change (Event-Driven aspect)
-            if latest_score:
-                yield build_nba_state_dict(latest_score, markets, event_ticker=event_ticker, ts_iso=tick.ts_iso.isoformat())
-                last_emit = datetime.now(timezone.utc)
-                did_update = True
-
-        # C. Heartbeat Emission (Clock-Driven aspect)
-        # If no ticks happened for 1.0 second, but we have a score, emit the state.
-        # This records the passage of game time even if markets are silent.
-        now = datetime.now(timezone.utc)
-        if latest_score and (now - last_emit).total_seconds() >= 1.0:
-            yield build_nba_state_dict(latest_score, markets, event_ticker=event_ticker, ts_iso=now.isoformat())
-            last_emit = now
-            did_update = True
-
-        # D. Throttle
-        if not did_update:
-            await asyncio.sleep(0.1)  # Sleep brief to yield CPU
-
-    # Cleanup
-    t_task.cancel()
-    s_task.cancel()
-    with suppress(asyncio.CancelledError):
-        await t_task
-        await s_task
+            # C. Heartbeat Emission (Clock-Driven aspect)
+            # If no ticks happened for 1.0 second, but we have a score, emit the state.
+            # This records the passage of game time even if markets are silent.
+            now = loop.time()
+            if latest_score and now - last_emit >= 1.0:
+                if base_stale:
+                    state_base = build_nba_state_base(latest_score, event_ticker=event_ticker)
+                    base_stale = False
+                yield build_nba_state_dict(latest_score, markets, event_ticker=event_ticker, ts_iso=datetime.now(timezone.utc).isoformat(), base=state_base)
+                last_emit = now
+    finally:
+        # Runs on normal exhaustion and when the consumer stops early
+        # (break + aclose), so the pumps never outlive the merged stream.
+        if wake_task is not None:
+            wake_task.cancel()
+        t_task.cancel()
+        s_task.cancel()
+        for task in (t_task, s_task):
+            with suppress(asyncio.CancelledError):
+                await task
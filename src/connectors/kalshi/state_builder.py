@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Dict, List, Optional
 
@@ -21,6 +21,13 @@ class MarketGroupConfig:
     event_ticker: str
     market_tickers: List[str]
     market_type: str = "binary"   # generic; domain can override meaning
+    # Keep each WS payload under meta["raw"] (debugging; holds every frame alive)
+    include_raw: bool = False
+    # Hashed copy of market_tickers for the per-frame membership test
+    ticker_set: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.ticker_set = frozenset(self.market_tickers)
 
 
 def _norm_cents(val: Any) -> Optional[float]:
@@ -42,12 +49,18 @@ async def kalshi_state_stream(
     At each tick:
       - update snapshot for the specific market
       - emit a BaseState with ALL current markets in the group
+
+    The yielded "markets" list is one list patched in place as snapshots are
+    replaced; copy it to keep a state across ticks.
     """
-    last_snapshots: Dict[str, BaseMarket] = {}
+    # Markets in first-seen order, plus each market's slot in that list, so a
+    # tick replaces one entry instead of rebuilding the list.
+    markets_view: List[BaseMarket] = []
+    market_index: Dict[str, int] = {}
 
     async for payload in kalshi_ticker_stream(cfg.market_tickers):
         mkt = payload.get("market_ticker")
-        if mkt not in cfg.market_tickers:
+        if mkt not in cfg.ticker_set:
             continue
 
         kalshi_ts = payload.get("ts")  # seconds since epoch
@@ -72,26 +85,32 @@ async def kalshi_state_stream(
         else:
             status = None
 
-        snapshot = BaseMarket(
-            market_id=mkt,
-            event_ticker=cfg.event_ticker,
-            type=cfg.market_type,
-            price=price,
-            yes_bid_prob=yes_bid,
-            yes_ask_prob=yes_ask,
-            bid_ask_spread=spread,
-            volume=payload.get("volume"),
-            open_interest=payload.get("open_interest"),
-            status=status,
-            result=None,
-            meta={"raw": payload},
-        )
-        last_snapshots[mkt] = snapshot
+        # Dict display rather than BaseMarket(**kwargs): same dict, no kwargs pass
+        snapshot: BaseMarket = {
+            "market_id": mkt,
+            "event_ticker": cfg.event_ticker,
+            "type": cfg.market_type,
+            "price": price,
+            "yes_bid_prob": yes_bid,
+            "yes_ask_prob": yes_ask,
+            "bid_ask_spread": spread,
+            "volume": payload.get("volume"),
+            "open_interest": payload.get("open_interest"),
+            "status": status,
+            "result": None,
+            "meta": {"raw": payload} if cfg.include_raw else {},
+        }
+        idx = market_index.get(mkt)
+        if idx is None:
+            market_index[mkt] = len(markets_view)
+            markets_view.append(snapshot)
+        else:
+            markets_view[idx] = snapshot
 
         state = BaseState(
             timestamp=ts_iso,
             event_ticker=cfg.event_ticker,
-            markets=list(last_snapshots.values()),
+            markets=markets_view,
             # domain-specific context (NBA, etc.) gets added upstream
             context={},
         )
@@ -2,18 +2,296 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
 
 import websockets
 
 from src.connectors.kalshi.auth import WS_URL, build_ws_headers
+from src.connectors.kalshi.ws_stream import (
+    PING_INTERVAL_SECS,
+    PING_TIMEOUT_SECS,
+    RECONNECT_BACKOFF_MAX_SECS,
+    RECONNECT_BACKOFF_MIN_SECS,
+)
+from src.core.jsonio import JSONDecodeError, dumps, loads
+
+
+def _cents_to_prob(v: Any) -> float | None:
+    # Slow path for non-numeric cents (strings, junk)
+    if v is None:
+        return None
+    try:
+        return float(v) / 100.0
+    except (TypeError, ValueError):
+        return None
+
+
+# Last (kalshi ts, ISO string) pair. Kalshi stamps ticks in whole seconds, so
+# every market updating within one second (across all streams in the process)
+# shares one formatted string.
+_ts_cache: List[Any] = [None, ""]
+
+
+def parse_ticker_payload(payload: Dict[str, Any], market_ticker: str) -> Dict[str, Any]:
+    """
+    Normalizes one ticker 'msg' payload into the dict ticker_stream yields.
+    Kalshi sends integer cents, so prices are scaled inline; anything the
+    plain division rejects goes through the guarded _cents_to_prob.
+    """
+    kalshi_ts = payload.get("ts")
+    if isinstance(kalshi_ts, (int, float)):
+        if kalshi_ts == _ts_cache[0]:
+            ts_iso = _ts_cache[1]
+        else:
+            ts_iso = datetime.fromtimestamp(kalshi_ts, tz=timezone.utc).isoformat()
+            _ts_cache[0] = kalshi_ts
+            _ts_cache[1] = ts_iso
+    else:
+        ts_iso = datetime.now(timezone.utc).isoformat()
+
+    price = payload.get("price")
+    yes_bid = payload.get("yes_bid")
+    yes_ask = payload.get("yes_ask")
+    try:
+        price_prob = None if price is None else price / 100.0
+        yes_bid_prob = None if yes_bid is None else yes_bid / 100.0
+        yes_ask_prob = None if yes_ask is None else yes_ask / 100.0
+    except TypeError:
+        price_prob = _cents_to_prob(price)
+        yes_bid_prob = _cents_to_prob(yes_bid)
+        yes_ask_prob = _cents_to_prob(yes_ask)
+
+    return {
+        "ts_iso": ts_iso,
+        "kalshi_ts": kalshi_ts,
+        "market_ticker": market_ticker,
+        "price_prob": price_prob,
+        "yes_bid_prob": yes_bid_prob,
+        "yes_ask_prob": yes_ask_prob,
+        "volume": payload.get("volume"),
+        "open_interest": payload.get("open_interest"),
+        "status": payload.get("status"),
+    }
+
+
+# Per-subscriber backlog. A full queue drops its oldest tick so one slow game
+# never stalls the socket every other game reads from; subscribers get no
+# backpressure from the hub, so drops are counted and logged instead.
+SUBSCRIBER_QUEUE_MAX = 4096
+# A subscriber's drops are reported on the first and then every this many
+DROP_LOG_EVERY = 1000
+
+
+class KalshiTickerHub:
+    """
+    One Kalshi ticker socket for every ticker_stream in the process. Each
+    subscriber's markets are added to the shared subscription, every frame is
+    decoded once and routed by market_ticker to the subscribers that asked for
+    it. A market whose last subscriber leaves is removed from the Kalshi
+    subscription; the socket closes when the last subscriber leaves.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._ws: Any = None
+        self._next_cmd_id = 1
+        # subscribe cmd id -> its markets, until Kalshi acks it with a sid
+        self._pending_subs: Dict[int, List[str]] = {}
+        # Kalshi subscription id -> markets it still covers
+        self._sid_markets: Dict[int, Set[str]] = {}
+        self._drops: Dict[asyncio.Queue, int] = {}
+
+    async def subscribe(self, market_tickers: Iterable[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Same contract as ticker_stream, fed by the shared socket.
+        """
+        market_tickers = list(market_tickers)
+        q: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_MAX)
+        new = [mt for mt in market_tickers if mt not in self._subscribers]
+        for mt in market_tickers:
+            self._subscribers.setdefault(mt, []).append(q)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        elif new and self._ws is not None:
+            # Connected already: add just the new markets. If this send fails
+            # the socket is going down and the reconnect subscribes everything.
+            try:
+                await self._send_subscribe(self._ws, new)
+            except Exception as e:
+                print(f"[ticker_stream] subscribe failed: {e!r}")
+
+        try:
+            while True:
+                yield await q.get()
+        finally:
+            self._drops.pop(q, None)
+            released = []
+            for mt in market_tickers:
+                subs = self._subscribers.get(mt, [])
+                if q in subs:
+                    subs.remove(q)
+                if not subs and self._subscribers.pop(mt, None) is not None:
+                    released.append(mt)
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                self._task = None
+            elif released and self._ws is not None:
+                # Stop Kalshi sending (and us decoding) frames nobody reads.
+                # A failed send means the socket is going down; the reconnect
+                # only subscribes markets that still have subscribers.
+                try:
+                    await self._send_release(self._ws, released)
+                except Exception as e:
+                    print(f"[ticker_stream] unsubscribe failed: {e!r}")
+
+    async def _send_cmd(self, ws: Any, cmd: str, params: Dict[str, Any]) -> int:
+        cmd_id = self._next_cmd_id
+        self._next_cmd_id += 1
+        # bytes would go out as a binary frame; send commands as text
+        await ws.send(dumps({"id": cmd_id, "cmd": cmd, "params": params}).decode())
+        return cmd_id
+
+    async def _send_subscribe(self, ws: Any, market_tickers: List[str]) -> None:
+        # Recorded before the send so the ack can never arrive first
+        cmd_id = self._next_cmd_id
+        self._pending_subs[cmd_id] = list(market_tickers)
+        await self._send_cmd(ws, "subscribe", {
+            "channels": ["ticker"],
+            "market_tickers": market_tickers,
+        })
+        print(
+            f"[ticker_stream] subscribed to {len(market_tickers)} markets: "
+            f"{market_tickers}"
+        )
+
+    async def _send_release(self, ws: Any, market_tickers: List[str]) -> None:
+        """
+        Drops markets from the subscriptions that cover them: update_subscription
+        for a sid that still covers others, unsubscribe for one left empty.
+        Markets whose subscribe is not acked yet are dropped on the ack.
+        """
+        gone = set(market_tickers)
+        updates: List[Any] = []
+        empty: List[int] = []
+        for sid, markets in list(self._sid_markets.items()):
+            hit = markets & gone
+            if not hit:
+                continue
+            markets -= hit
+            if markets:
+                updates.append((sid, sorted(hit)))
+            else:
+                del self._sid_markets[sid]
+                empty.append(sid)
+
+        for sid, hit in updates:
+            await self._send_cmd(ws, "update_subscription", {
+                "sids": [sid],
+                "market_tickers": hit,
+                "action": "delete_markets",
+            })
+        if empty:
+            await self._send_cmd(ws, "unsubscribe", {"sids": empty})
+        if updates or empty:
+            print(f"[ticker_stream] unsubscribed from {len(gone)} markets: {sorted(gone)}")
+
+    async def _on_subscribed(self, ws: Any, msg: Dict[str, Any]) -> None:
+        markets = self._pending_subs.pop(msg.get("id"), None)
+        sid = (msg.get("msg") or {}).get("sid")
+        if markets is None or sid is None:
+            return
+        self._sid_markets[sid] = set(markets)
+        # Subscribers that left while the subscribe was in flight
+        gone = [mt for mt in markets if mt not in self._subscribers]
+        if gone:
+            await self._send_release(ws, gone)
+
+    def _drop_oldest(self, q: asyncio.Queue, market_ticker: str) -> None:
+        q.get_nowait()
+        n = self._drops.get(q, 0) + 1
+        self._drops[q] = n
+        if n == 1 or n % DROP_LOG_EVERY == 0:
+            print(
+                f"[ticker_stream] subscriber behind on {market_ticker}; "
+                f"dropped {n} oldest ticks so far"
+            )
+
+    async def _run(self) -> None:
+        backoff = RECONNECT_BACKOFF_MIN_SECS
+        while self._subscribers:
+            # RSA signing is CPU work; keep it off the shared event loop.
+            headers = await asyncio.to_thread(build_ws_headers)
+            ws = None
+            try:
+                async with websockets.connect(
+                    WS_URL,
+                    additional_headers=headers,  # IMPORTANT: this matches your scraper code
+                    ping_interval=PING_INTERVAL_SECS,
+                    ping_timeout=PING_TIMEOUT_SECS,
+                ) as ws:
+                    self._ws = ws
+                    # sids belong to the old connection
+                    self._pending_subs.clear()
+                    self._sid_markets.clear()
+                    await self._send_subscribe(ws, list(self._subscribers))
+                    backoff = RECONNECT_BACKOFF_MIN_SECS
+
+                    # Every frame is decoded here, so use orjson (via jsonio)
+                    async for raw in ws:
+                        try:
+                            msg = loads(raw)
+                        except JSONDecodeError:
+                            continue
+
+                        msg_type = msg.get("type")
+                        if msg_type != "ticker":
+                            if msg_type == "subscribed":
+                                await self._on_subscribed(ws, msg)
+                            continue
+
+                        payload = msg.get("msg") or {}
+                        market_ticker = payload.get("market_ticker")
+                        queues = self._subscribers.get(market_ticker)
+                        if not queues:
+                            continue
+
+                        tick = parse_ticker_payload(payload, market_ticker)
+                        for q in queues:
+                            if q.full():  # slow subscriber: keep the newest
+                                self._drop_oldest(q, market_ticker)
+                            q.put_nowait(tick)
+
+                print("[ticker_stream] WS closed; reconnecting...")
+            except Exception as e:
+                print(f"[ticker_stream] WS error: {e!r}; reconnecting in {backoff:.0f}s...")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX_SECS)
+            finally:
+                # A cancelled predecessor must not clear a newer task's socket
+                if self._ws is ws:
+                    self._ws = None
+
+
+_HUB: Optional[KalshiTickerHub] = None
+
+
+def get_ticker_hub() -> KalshiTickerHub:
+    """
+    Process-wide ticker hub, shared by every worker task.
+    """
+    global _HUB
+    if _HUB is None:
+        _HUB = KalshiTickerHub()
+    return _HUB
 
 
 async def ticker_stream(market_tickers: List[str]) -> AsyncIterator[Dict[str, Any]]:
     """
     Async generator yielding normalized ticker messages for the given market_tickers.
+    All streams in the process share one Kalshi socket (see KalshiTickerHub).
 
     Yields dicts:
       {
@@ -28,71 +306,5 @@ async def ticker_stream(market_tickers: List[str]) -> AsyncIterator[Dict[str, An
         "status": Any,
       }
     """
-    while True:
-        headers = build_ws_headers()
-        try:
-            async with websockets.connect(
-                WS_URL,
-                additional_headers=headers,  # IMPORTANT: this matches your scraper code
-            ) as ws:
-                sub_msg = {
-                    "id": 1,
-                    "cmd": "subscribe",
-                    "params": {
-                        "channels": ["ticker"],
-                        "market_tickers": market_tickers,
-                    },
-                }
-                await ws.send(json.dumps(sub_msg))
-                print(
-                    f"[ticker_stream] subscribed to {len(market_tickers)} markets: "
-                    f"{market_tickers}"
-                )
-
-                async for raw in ws:
-                    try:
-                        msg = json.loads(raw)
-                    except json.JSONDecodeError:
-                        continue
-
-                    if msg.get("type") != "ticker":
-                        continue
-
-                    payload = msg.get("msg") or {}
-                    market_ticker = payload.get("market_ticker")
-                    if not market_ticker:
-                        continue
-
-                    kalshi_ts = payload.get("ts")
-
-                    if isinstance(kalshi_ts, (int, float)):
-                        ts_iso = datetime.fromtimestamp(
-                            kalshi_ts, tz=timezone.utc
-                        ).isoformat()
-                    else:
-                        ts_iso = datetime.now(timezone.utc).isoformat()
-
-                    def norm_cents(field: str) -> float | None:
-                        v = payload.get(field)
-                        if v is None:
-                            return None
-                        try:
-                            return float(v) / 100.0
-                        except Exception:
-                            return None
-
-                    yield {
-                        "ts_iso": ts_iso,
-                        "kalshi_ts": kalshi_ts,
-                        "market_ticker": market_ticker,
-                        "price_prob": norm_cents("price"),
-                        "yes_bid_prob": norm_cents("yes_bid"),
-                        "yes_ask_prob": norm_cents("yes_ask"),
-                        "volume": payload.get("volume"),
-                        "open_interest": payload.get("open_interest"),
-                        "status": payload.get("status"),
-                    }
-
-        except Exception as e:
-            print(f"[ticker_stream] WS error: {e!r}; reconnecting in 3s...")
-            await asyncio.sleep(3.0)
+    async for tick in get_ticker_hub().subscribe(market_tickers):
+        yield tick
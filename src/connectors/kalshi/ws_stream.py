@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Dict, List
 
 import websockets  # from requirements.txt
 
-from .auth import create_ws_headers
+from src.core.jsonio import JSONDecodeError, dumps, loads
 
-WS_URL = "wss://api.elections.kalshi.com/trade-api/ws/v2"
-INACTIVITY_RECONNECT_SECS = 90.0
+from .auth import WS_URL, build_ws_headers
+
+# Liveness comes from the library's protocol-level PING/PONG: a peer that
+# misses a pong within PING_TIMEOUT_SECS gets the connection closed, which
+# ends the receive loop and triggers a reconnect.
+PING_INTERVAL_SECS = 20.0
+PING_TIMEOUT_SECS = 20.0
+# Reconnect delay doubles per consecutive failure, reset once subscribed
+RECONNECT_BACKOFF_MIN_SECS = 1.0
+RECONNECT_BACKOFF_MAX_SECS = 30.0
 
 
 async def kalshi_ticker_stream(
@@ -21,18 +27,22 @@ async def kalshi_ticker_stream(
     market_tickers.
 
     Yields the 'msg' dict for messages with type == 'ticker'.
-    Handles reconnect-on-idle.
+    Reconnects with backoff when the socket closes or stops answering pings.
     """
     if not market_tickers:
         raise ValueError(
             "kalshi_ticker_stream requires at least one market_ticker")
 
+    backoff = RECONNECT_BACKOFF_MIN_SECS
     while True:
-        headers = create_ws_headers()
+        # Signed with the key auth.py parses once per process, off the loop
+        headers = await asyncio.to_thread(build_ws_headers)
         try:
             async with websockets.connect(
                 WS_URL,
                 additional_headers=headers,
+                ping_interval=PING_INTERVAL_SECS,
+                ping_timeout=PING_TIMEOUT_SECS,
             ) as ws:
                 sub_msg = {
                     "id": 1,
@@ -42,35 +52,24 @@ async def kalshi_ticker_stream(
                         "market_tickers": market_tickers,
                     },
                 }
-                await ws.send(json.dumps(sub_msg))
-
-                last_ticker_ts = datetime.now(timezone.utc)
-
-                while True:
-                    try:
-                        raw = await asyncio.wait_for(ws.recv(), timeout=30.0)
-                    except asyncio.TimeoutError:
-                        idle = (datetime.now(timezone.utc) -
-                                last_ticker_ts).total_seconds()
-                        if idle > INACTIVITY_RECONNECT_SECS:
-                            print(
-                                f"[kalshi_ticker_stream] idle {idle:.0f}s, reconnecting..."
-                            )
-                            break
-                        continue
+                # bytes would go out as a binary frame; subscribe as text
+                await ws.send(dumps(sub_msg).decode())
+                backoff = RECONNECT_BACKOFF_MIN_SECS
 
+                async for raw in ws:
                     try:
-                        msg = json.loads(raw)
-                    except json.JSONDecodeError:
+                        msg = loads(raw)
+                    except JSONDecodeError:
                         continue
 
                     if msg.get("type") != "ticker":
                         continue
 
-                    last_ticker_ts = datetime.now(timezone.utc)
                     payload = msg.get("msg") or {}
                     yield payload
 
+            print("[kalshi_ticker_stream] WS closed, reconnecting...")
         except Exception as e:  # noqa: BLE001
-            print(f"[kalshi_ticker_stream] WS error: {e!r}, backing off...")
-            await asyncio.sleep(5.0)
+            print(f"[kalshi_ticker_stream] WS error: {e!r}, backing off {backoff:.0f}s...")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX_SECS)
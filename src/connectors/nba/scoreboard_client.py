@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import re
 import requests
 import traceback
 from dataclasses import dataclass
@@ -12,26 +14,121 @@ from typing import Dict, Optional, AsyncIterator, Any
 from zoneinfo import ZoneInfo
 from nba_api.stats.endpoints import scoreboardv2
 from nba_api.stats.static import teams
+from requests.adapters import HTTPAdapter
 
+from src.core.jsonio import loads
 from src.core.nba_models import NBAScoreboardSnapshot
+from src.core.polling import AdaptivePollInterval
 
 
 class NBAScoreboardError(RuntimeError):
     pass
 
 
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+    "Referer": "https://www.nba.com/",
+    "Origin": "https://www.nba.com"
+}
+
+# Every game's poller fetches its own boxscore, so nothing to coalesce, but
+# they share one keep-alive session to cdn.nba.com. Fetches run on the loop's
+# default executor, which is sized to the machine rather than a fixed few
+# threads that a full slate of live games would queue behind.
+_SHARED_SESSION: Optional[requests.Session] = None
+# One keep-alive connection per concurrently polling game; an NBA slate tops
+# out at 15, past requests' default pool of 10.
+POOL_MAXSIZE = 16
+
+# CDN gameClock is ISO-8601 duration style, e.g. "PT05M23.00S"
+_CLOCK_RE = re.compile(r"PT(\d+)M(\d+(?:\.\d+)?)S")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_pt_clock(clock: str) -> float:
+    # Seconds left in the period. Clocks repeat across polls (and games) while
+    # play is stopped, and a period has few distinct values, so memoize.
+    m = _CLOCK_RE.match(clock)
+    return int(m.group(1)) * 60 + float(m.group(2)) if m else 0.0
+
+
+# nba_api's static team list, indexed once (find_team_name_by_id scans it)
+_TEAM_ABBR_BY_ID: Dict[int, str] = {
+    int(t["id"]): t["abbreviation"] for t in teams.get_teams()}
+
+# Shared read-only stand-in for a missing lookup; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+CDN_SCOREBOARD_URL = "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+
+
+def _shared_session() -> requests.Session:
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        _SHARED_SESSION = requests.Session()
+        _SHARED_SESSION.mount("https://", HTTPAdapter(
+            pool_connections=1, pool_maxsize=POOL_MAXSIZE))
+        _SHARED_SESSION.headers.update(_BROWSER_HEADERS)
+    return _SHARED_SESSION
+
+
 class NBAScoreboardClient:
     def __init__(self, timezone: str = "America/New_York") -> None:
         self.tz = ZoneInfo(timezone)
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-            "Referer": "https://www.nba.com/",
-            "Origin": "https://www.nba.com"
-        })
+        self.session = _shared_session()
 
     # 1. DISCOVERY
     def fetch_scoreboard_for_date(self, target_date: date) -> Dict[str, NBAScoreboardSnapshot]:
+        out = None
+        if target_date == datetime.now(self.tz).date():
+            out = self._fetch_cdn_scoreboard(target_date)
+        if out is None:
+            out = self._fetch_scoreboard_v2(target_date)
+        return out
+
+    def _fetch_cdn_scoreboard(self, target_date: date) -> Optional[Dict[str, NBAScoreboardSnapshot]]:
+        """
+        Today's slate from the static CDN feed (~100ms vs seconds for
+        ScoreboardV2). None when the feed fails or has not yet rolled over to
+        target_date, so the caller falls back to ScoreboardV2.
+        """
+        try:
+            resp = self.session.get(CDN_SCOREBOARD_URL, timeout=5.0)
+            resp.raise_for_status()
+            board = loads(resp.content).get("scoreboard") or {}
+        except Exception:
+            return None
+
+        if board.get("gameDate") != target_date.isoformat():
+            return None
+
+        now = datetime.now(self.tz)
+        out = {}
+        for g in board.get("games") or []:
+            gid = str(g.get("gameId") or "")
+            if not gid:
+                continue
+            home = g.get("homeTeam") or _EMPTY
+            away = g.get("awayTeam") or _EMPTY
+            # Same shape as the ScoreboardV2 path: discovery only reads ids,
+            # teams and the status text ("7:30 pm ET" before tipoff).
+            out[gid] = NBAScoreboardSnapshot(
+                game_id=gid,
+                home_team=(home.get("teamTricode") or "").upper(),
+                away_team=(away.get("teamTricode") or "").upper(),
+                score_home=0, score_away=0, quarter=0,
+                time_remaining_minutes=0.0, time_remaining_quarter_seconds=0.0,
+                status=(g.get("gameStatusText") or "").strip(),
+                timestamp=now,
+                possession_team_id=None,
+                in_bonus_home=False, in_bonus_away=False,
+                fouls_home=0, fouls_away=0,
+                timeouts_home=0, timeouts_away=0,
+                extra={}
+            )
+        return out
+
+    def _fetch_scoreboard_v2(self, target_date: date) -> Dict[str, NBAScoreboardSnapshot]:
         ds = target_date.strftime("%m/%d/%Y")
 
         # We allow this to crash if it fails so we see it in logs
@@ -42,10 +139,13 @@ class NBAScoreboardClient:
         headers = data.get("GameHeader", []) or []
         lines = data.get("LineScore", []) or []
 
-        line_index = {}
+        # GAME_ID -> TEAM_ID -> LineScore row; one inner dict serves both teams
+        line_index: Dict[str, Dict[int, Dict[str, Any]]] = {}
         for row in lines:
-            if row.get("GAME_ID") and row.get("TEAM_ID"):
-                line_index[(str(row["GAME_ID"]), int(row["TEAM_ID"]))] = row
+            row_gid = row.get("GAME_ID")
+            row_tid = row.get("TEAM_ID")
+            if row_gid and row_tid:
+                line_index.setdefault(str(row_gid), {})[int(row_tid)] = row
 
         now = datetime.now(self.tz)
         out = {}
@@ -55,22 +155,16 @@ class NBAScoreboardClient:
             home_id = int(h.get("HOME_TEAM_ID") or 0)
             away_id = int(h.get("VISITOR_TEAM_ID") or 0)
 
-            home_line = line_index.get((gid, home_id), {})
-            away_line = line_index.get((gid, away_id), {})
+            per_game = line_index.get(gid) or _EMPTY
+            home_line = per_game.get(home_id) or _EMPTY
+            away_line = per_game.get(away_id) or _EMPTY
 
             h_abbr = (home_line.get("TEAM_ABBREVIATION") or "").strip().upper()
             a_abbr = (away_line.get("TEAM_ABBREVIATION") or "").strip().upper()
 
             # --- FALLBACK RESTORED ---
-            if not h_abbr and home_id:
-                t_info = teams.find_team_name_by_id(home_id)
-                if t_info:
-                    h_abbr = t_info.get("abbreviation", "")
-
-            if not a_abbr and away_id:
-                t_info = teams.find_team_name_by_id(away_id)
-                if t_info:
-                    a_abbr = t_info.get("abbreviation", "")
+            h_abbr = h_abbr or _TEAM_ABBR_BY_ID.get(home_id, "")
+            a_abbr = a_abbr or _TEAM_ABBR_BY_ID.get(away_id, "")
             # -------------------------
 
             out[gid] = NBAScoreboardSnapshot(
@@ -96,7 +190,7 @@ class NBAScoreboardClient:
             if resp.status_code == 404:
                 return None
             resp.raise_for_status()
-            data = resp.json()
+            data = loads(resp.content)
         except Exception:
             return None
 
@@ -115,18 +209,7 @@ class NBAScoreboardClient:
         except:
             score_home, score_away = 0, 0
 
-        clock_str = game.get("gameClock", "")
-        minutes = 0.0
-        seconds = 0.0
-        if "M" in clock_str and "S" in clock_str:
-            try:
-                clean = clock_str.replace("PT", "")
-                parts = clean.split("M")
-                minutes = float(parts[0])
-                seconds = float(parts[1].replace("S", ""))
-            except:
-                pass
-        time_rem_sec = (minutes * 60) + seconds
+        time_rem_sec = _parse_pt_clock(game.get("gameClock") or "")
 
         # --- STATS EXTRACTION ---
         def get_stat(team_obj, key):
@@ -182,12 +265,18 @@ class NBAScoreboardClient:
             extra={}
         )
 
-    async def poll_game(self, game_id: str, *, poll_interval: float = 1.0, stop_on_final: bool = True, target_date: Optional[date] = None) -> AsyncIterator[NBAScoreboardSnapshot]:
+    async def poll_game(self, game_id: str, *, poll_interval: float = 1.0, stop_on_final: bool = True, target_date: Optional[date] = None, tipoff_ns: Optional[int] = None) -> AsyncIterator[NBAScoreboardSnapshot]:
         loop = asyncio.get_running_loop()
+        pacer = AdaptivePollInterval(poll_interval, tipoff_ns)
         while True:
             snap = await loop.run_in_executor(None, self._fetch_cdn_boxscore, game_id)
+            delay = poll_interval
             if snap:
                 yield snap
                 if stop_on_final and "Final" in snap.status:
                     return
-            await asyncio.sleep(poll_interval)
+                delay = pacer.next(
+                    (snap.score_home, snap.score_away, snap.quarter,
+                     snap.time_remaining_quarter_seconds),
+                    status=snap.status, period=snap.quarter)
+            await asyncio.sleep(delay)
@@ -3,19 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import re
 import requests
 from datetime import datetime, date
 from typing import Dict, Any, Optional, AsyncIterator, List
 
 from zoneinfo import ZoneInfo
+from src.core.jsonio import loads
 from src.core.nfl_models import NFLScoreboardSnapshot
+from src.core.polling import AdaptivePollInterval
 
 log = logging.getLogger(__name__)
 
 BASE_URL = "http://site.api.espn.com/apis/site/v2/sports/football/nfl"
 
 
+def _split_home_away(comps: List[Dict[str, Any]]) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    # One pass over an ESPN competitors list; first entry per side wins
+    home: Dict[str, Any] = {}
+    away: Dict[str, Any] = {}
+    for c in comps:
+        side = c.get("homeAway")
+        if side == "home":
+            home = home or c
+        elif side == "away":
+            away = away or c
+    return home, away
+
+
+def _pace_key(snap: NFLScoreboardSnapshot) -> tuple:
+    # What moves during live play; unchanged across polls means a stoppage
+    return (snap.score_home, snap.score_away, snap.quarter,
+            snap.time_remaining_quarter_seconds, snap.down, snap.yardline)
+
+
+_MMSS_RE = re.compile(r"(\d+):(\d+(?:\.\d+)?)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_display_clock(display_clock: str) -> float:
+    # Seconds left in the quarter from ESPN's "MM:SS". The clock sits still
+    # between plays, so most polls repeat the previous string; memoize.
+    m = _MMSS_RE.match(display_clock)
+    return int(m.group(1)) * 60 + float(m.group(2)) if m else 0.0
+
+
 class NFLScoreboardClient:
     def __init__(self, timezone: str = "America/New_York") -> None:
         self.tz = ZoneInfo(timezone)
@@ -30,7 +64,7 @@ class NFLScoreboardClient:
         try:
             resp = self.session.get(url, timeout=10)
             resp.raise_for_status()
-            data = resp.json()
+            data = loads(resp.content)
         except Exception:
             return []
 
@@ -39,10 +73,7 @@ class NFLScoreboardClient:
             try:
                 game_id = evt.get("id")
                 comps = evt.get("competitions", [])[0].get("competitors", [])
-                home = next(
-                    (c for c in comps if c.get("homeAway") == "home"), {})
-                away = next(
-                    (c for c in comps if c.get("homeAway") == "away"), {})
+                home, away = _split_home_away(comps)
                 if game_id and home and away:
                     games_out.append({
                         "game_id": str(game_id),
@@ -64,7 +95,7 @@ class NFLScoreboardClient:
         try:
             resp = self.session.get(url, timeout=4.0)
             resp.raise_for_status()
-            data = resp.json()
+            data = loads(resp.content)
         except Exception:
             return None
 
@@ -76,10 +107,25 @@ class NFLScoreboardClient:
         # <--- CRITICAL FIX: Scope to competition
         competition = competitions[0]
 
+        return self._snapshot_from_competition(
+            game_id, competition, data.get("situation", {}), data.get("drives", {}))
+
+    def _snapshot_from_competition(
+        self,
+        game_id: str,
+        competition: Dict[str, Any],
+        sit: Dict[str, Any],
+        drives: Dict[str, Any],
+        now: Optional[datetime] = None,
+    ) -> NFLScoreboardSnapshot:
+        """
+        Snapshot from one ESPN competition object. Shared by the per-game
+        summary endpoint and the all-games scoreboard endpoint.
+        `now` is the fetch time; one response's games share a single stamp.
+        """
         # 2. Teams & Scores
         comps = competition.get("competitors", [])
-        home_comp = next((c for c in comps if c.get("homeAway") == "home"), {})
-        away_comp = next((c for c in comps if c.get("homeAway") == "away"), {})
+        home_comp, away_comp = _split_home_away(comps)
 
         home_team = home_comp.get("team", {}).get("abbreviation", "UNK")
         away_team = away_comp.get("team", {}).get("abbreviation", "UNK")
@@ -97,18 +143,7 @@ class NFLScoreboardClient:
         status_data = competition.get("status", {})
         status_text = status_data.get("type", {}).get("detail", "")
         quarter = status_data.get("period", 0)
-        display_clock = status_data.get("displayClock", "0:00")
-
-        minutes, seconds = 0.0, 0.0
-        if ":" in display_clock:
-            parts = display_clock.split(":")
-            try:
-                minutes = float(parts[0])
-                seconds = float(parts[1])
-            except:
-                pass
-
-        time_rem_sec = (minutes * 60) + seconds
+        time_rem_sec = _parse_display_clock(status_data.get("displayClock", "0:00"))
 
         # 4. Situation Extraction
         possession_team = None
@@ -117,12 +152,8 @@ class NFLScoreboardClient:
         yardline = 0
         last_play_text = ""
 
-        # Root Situation
-        sit = data.get("situation", {})
-
         # Drive Fallback
         if not sit:
-            drives = data.get("drives", {})
             current_drive = drives.get("current", {})
             if current_drive:
                 plays = current_drive.get("plays", [])
@@ -170,17 +201,162 @@ class NFLScoreboardClient:
             distance=distance,
             yardline=yardline,
             status=status_text,
-            timestamp=datetime.now(self.tz),
+            timestamp=now or datetime.now(self.tz),
             last_play=last_play_text,
             extra={}
         )
 
-    async def poll_game(self, game_id: str, *, poll_interval: float = 1.0, stop_on_final: bool = True) -> AsyncIterator[NFLScoreboardSnapshot]:
+    async def poll_game(self, game_id: str, *, poll_interval: float = 1.0, stop_on_final: bool = True, tipoff_ns: Optional[int] = None) -> AsyncIterator[NFLScoreboardSnapshot]:
         loop = asyncio.get_running_loop()
+        pacer = AdaptivePollInterval(poll_interval, tipoff_ns)
         while True:
             snap = await loop.run_in_executor(None, self._fetch_live_summary, game_id)
+            delay = poll_interval
             if snap:
                 yield snap
                 if stop_on_final and "Final" in snap.status:
                     return
-            await asyncio.sleep(poll_interval)
+                delay = pacer.next(_pace_key(snap), status=snap.status, period=snap.quarter)
+            await asyncio.sleep(delay)
+
+    # -------------------------------------------------------------------------
+    # 3. ALL GAMES AT ONCE (Scoreboard)
+    # -------------------------------------------------------------------------
+
+    def fetch_live_snapshots(self) -> Dict[str, NFLScoreboardSnapshot]:
+        """
+        {game_id: snapshot} for every game on ESPN's current scoreboard, in one request.
+        """
+        try:
+            resp = self.session.get(f"{BASE_URL}/scoreboard", timeout=4.0)
+            resp.raise_for_status()
+            data = loads(resp.content)
+        except Exception:
+            return {}
+
+        now = datetime.now(self.tz)
+        out: Dict[str, NFLScoreboardSnapshot] = {}
+        for evt in data.get("events", []):
+            try:
+                game_id = str(evt["id"])
+                competition = evt["competitions"][0]
+                sit = competition.get("situation") or {}
+                state = competition.get("status", {}).get("type", {}).get("state")
+                if not sit and state == "in":
+                    # Live without a situation block: down/yardline/last play
+                    # only come from the summary's drives, so leave it out
+                    continue
+                out[game_id] = self._snapshot_from_competition(
+                    game_id, competition, sit, {}, now)
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+        return out
+
+
+class NFLScoreboardBroadcaster:
+    """
+    One poller for every live NFL game in the process. Each tick fetches the
+    full ESPN scoreboard once and hands each subscribed game its snapshot, so
+    G workers cost one request per interval instead of G. Games missing from
+    the scoreboard (or live there without a situation) fall back to the
+    per-game summary endpoint, fetched concurrently after the rest are served.
+    """
+
+    def __init__(self, client: Optional[NFLScoreboardClient] = None, *, poll_interval: float = 1.0) -> None:
+        self.client = client or NFLScoreboardClient()
+        self.poll_interval = poll_interval
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._pacers: Dict[str, AdaptivePollInterval] = {}
+        self._tipoffs: Dict[str, int] = {}
+
+    async def subscribe(self, game_id: str, *, stop_on_final: bool = True, tipoff_ns: Optional[int] = None) -> AsyncIterator[NFLScoreboardSnapshot]:
+        """
+        Same contract as NFLScoreboardClient.poll_game, fed by the shared poller.
+        """
+        q: asyncio.Queue = asyncio.Queue(maxsize=8)
+        self._subscribers.setdefault(game_id, []).append(q)
+        if tipoff_ns is not None:
+            self._tipoffs[game_id] = tipoff_ns
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        try:
+            while True:
+                snap = await q.get()
+                yield snap
+                if stop_on_final and "Final" in snap.status:
+                    return
+        finally:
+            subs = self._subscribers.get(game_id, [])
+            if q in subs:
+                subs.remove(q)
+            if not subs:
+                self._subscribers.pop(game_id, None)
+                self._tipoffs.pop(game_id, None)
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                self._task = None
+                self._pacers.clear()
+
+    def _deliver(self, game_id: str, snap: NFLScoreboardSnapshot) -> Optional[float]:
+        # Hands one snapshot to a game's subscribers; returns that game's next delay
+        queues = self._subscribers.get(game_id)
+        if not queues:
+            return None
+        for q in queues:
+            if q.full():  # slow subscriber: keep the newest
+                q.get_nowait()
+            q.put_nowait(snap)
+        pacer = self._pacers.get(game_id)
+        if pacer is None:
+            pacer = self._pacers[game_id] = AdaptivePollInterval(
+                self.poll_interval, self._tipoffs.get(game_id))
+        return pacer.next(_pace_key(snap), status=snap.status, period=snap.quarter)
+
+    async def _fallback(self, game_id: str) -> Optional[float]:
+        try:
+            snap = await asyncio.to_thread(self.client._fetch_live_summary, game_id)
+        except Exception as e:
+            log.warning(f"NFL summary fallback failed for {game_id}: {e}")
+            snap = None
+        if snap is None:
+            return self.poll_interval
+        return self._deliver(game_id, snap)
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            # One request serves every game, so poll as often as the most
+            # active subscribed game needs
+            delay = self.poll_interval
+            try:
+                snaps = await asyncio.to_thread(self.client.fetch_live_snapshots)
+                missing = [g for g in self._subscribers if g not in snaps]
+                delays = [self._deliver(g, snaps[g]) for g in list(self._subscribers) if g in snaps]
+
+                # Summary fallbacks run side by side, after the scoreboard games
+                # are served, and each is delivered as soon as it lands, so one
+                # slow ESPN call delays no other game
+                if missing:
+                    delays += await asyncio.gather(*(self._fallback(g) for g in missing))
+
+                delays = [d for d in delays if d is not None]
+                for game_id in [g for g in self._pacers if g not in self._subscribers]:
+                    del self._pacers[game_id]
+                if delays:
+                    delay = min(delays)
+            except Exception as e:
+                log.warning(f"NFL scoreboard broadcast failed: {e}")
+            await asyncio.sleep(delay)
+
+
+_BROADCASTERS: Dict[float, NFLScoreboardBroadcaster] = {}
+
+
+def get_scoreboard_broadcaster(poll_interval: float = 1.0) -> NFLScoreboardBroadcaster:
+    """
+    Process-wide broadcaster for a poll interval, shared by every worker task.
+    """
+    b = _BROADCASTERS.get(poll_interval)
+    if b is None:
+        b = _BROADCASTERS[poll_interval] = NFLScoreboardBroadcaster(poll_interval=poll_interval)
+    return b
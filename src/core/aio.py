@@ -0,0 +1,16 @@
+# src/core/aio.py
+from __future__ import annotations
+
+
+def install_uvloop() -> bool:
+    """
+    Makes uvloop the policy for subsequent asyncio.run() calls when it is
+    installed (it is not available on Windows). Returns True if it was installed.
+    Call from program entry points only; library code should not pick the loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
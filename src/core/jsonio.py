@@ -0,0 +1,46 @@
+# src/core/jsonio.py
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Fallback so deployments without orjson still work
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    # orjson serializes dataclasses natively; match it on the stdlib path
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 bytes. indent=True mirrors json.dump(..., indent=2).
+    Dataclass instances are written as objects.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    return loads(path.read_bytes())
+
+
+def write_json(path: Path, obj: Any, *, indent: bool = False) -> None:
+    path.write_bytes(dumps(obj, indent=indent))
@@ -85,33 +85,24 @@ class NBAScoreboardSnapshot:
 # Helper to build engine-ready NBA state
 # =========================
 
-def build_nba_state_dict(
+def build_nba_state_base(
     scoreboard: NBAScoreboardSnapshot,
-    markets: Dict[str, NBAMoneylineMarket],
     *,
     event_ticker: Optional[str] = None,
-    ts_iso: Optional[str] = None,
 ) -> NBAGameState:
-
-    ts = ts_iso or scoreboard.timestamp.isoformat()
+    """
+    Every field that depends only on the scoreboard snapshot. The merger builds
+    this once per new snapshot and reuses it for every emission until the next
+    one; "timestamp" and "markets" are placeholders filled per emission.
+    """
     score_home = float(scoreboard.score_home)
     score_away = float(scoreboard.score_away)
     score_diff = score_home - score_away
 
-    # Resolve Possession ID -> Abbreviation
-    # The API gives us an ID (e.g., 1610612747). We need to check which team that is.
-    # Note: We don't store team IDs in the Snapshot for Home/Away, only Abbrevs.
-    # But usually we can map it via the scoreboard object or just pass it through if needed.
-    # For now, let's try to map it if we can, or leave it as None if ambiguous.
-
-    # Simple logic: We don't have the Team ID -> Abbrev map here easily unless we stored it.
-    # But wait, the Scoreboard Client knows the IDs.
-    # Let's assume the Client resolves it to an Abbreviation string before passing it here?
-    # actually, let's make the Snapshot store the Abbreviation directly to simplify this function.
-    # See updated Client code below.
+    # Possession is resolved to an abbreviation by the scoreboard client.
 
     state: NBAGameState = {
-        "timestamp": ts,
+        "timestamp": "",
         "event_ticker": event_ticker or "",
         "game_id": scoreboard.game_id,
         "home_team": scoreboard.home_team,
@@ -133,7 +124,7 @@ def build_nba_state_dict(
         "timeouts_home": scoreboard.timeouts_home,
         "timeouts_away": scoreboard.timeouts_away,
 
-        "markets": list(markets.values()),
+        "markets": [],
         "context": {
             "nba_raw": {
                 "status": scoreboard.status,
@@ -143,3 +134,28 @@ def build_nba_state_dict(
         },
     }
     return state
+
+
+def build_nba_state_dict(
+    scoreboard: NBAScoreboardSnapshot,
+    markets: Dict[str, NBAMoneylineMarket],
+    *,
+    event_ticker: Optional[str] = None,
+    ts_iso: Optional[str] = None,
+    base: Optional[NBAGameState] = None,
+) -> NBAGameState:
+    """
+    Merge the Scoreboard Snapshot + Market Data into a final NBAGameState dict.
+    Pass `base` (from build_nba_state_base for the same snapshot) to skip
+    rebuilding the scoreboard fields; each call still returns a new dict,
+    with its own context.
+    """
+    if base is None:
+        base = build_nba_state_base(scoreboard, event_ticker=event_ticker)
+    state: NBAGameState = base.copy()
+    state["timestamp"] = ts_iso or scoreboard.timestamp.isoformat()
+    state["markets"] = list(markets.values())
+    # The nested context is per-state too, so a consumer that edits one
+    # emission's context does not change the others built from this base
+    state["context"] = {"nba_raw": base["context"]["nba_raw"].copy()}
+    return state
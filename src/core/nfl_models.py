@@ -92,18 +92,16 @@ class NFLScoreboardSnapshot:
 # Helper: Build State
 # =========================
 
-def build_nfl_state_dict(
+def build_nfl_state_base(
     scoreboard: NFLScoreboardSnapshot,
-    markets: Dict[str, NFLMoneylineMarket],
     *,
     event_ticker: Optional[str] = None,
-    ts_iso: Optional[str] = None,
 ) -> NFLGameState:
     """
-    Merge the Scoreboard Snapshot + Market Data into a final NFLGameState dict.
+    Every field that depends only on the scoreboard snapshot. The merger builds
+    this once per new snapshot and reuses it for every emission until the next
+    one; "timestamp" and "markets" are placeholders filled per emission.
     """
-    ts = ts_iso or scoreboard.timestamp.isoformat()
-
     # Derived Logic: Red Zone
     # Assuming yardline 0-100 where 100 is a touchdown.
     # (We will standardize this in the Connector).
@@ -112,7 +110,7 @@ def build_nfl_state_dict(
     score_diff = scoreboard.score_home - scoreboard.score_away
 
     state: NFLGameState = {
-        "timestamp": ts,
+        "timestamp": "",
         "event_ticker": event_ticker or "",
         "game_id": scoreboard.game_id,
         "home_team": scoreboard.home_team,
@@ -132,7 +130,7 @@ def build_nfl_state_dict(
         "is_redzone": is_redzone,
         "last_play_text": scoreboard.last_play,
 
-        "markets": list(markets.values()),
+        "markets": [],
         "context": {
             "nfl_raw": {
                 "status": scoreboard.status,
@@ -142,3 +140,28 @@ def build_nfl_state_dict(
         },
     }
     return state
+
+
+def build_nfl_state_dict(
+    scoreboard: NFLScoreboardSnapshot,
+    markets: Dict[str, NFLMoneylineMarket],
+    *,
+    event_ticker: Optional[str] = None,
+    ts_iso: Optional[str] = None,
+    base: Optional[NFLGameState] = None,
+) -> NFLGameState:
+    """
+    Merge the Scoreboard Snapshot + Market Data into a final NFLGameState dict.
+    Pass `base` (from build_nfl_state_base for the same snapshot) to skip
+    rebuilding the scoreboard fields; each call still returns a new dict,
+    with its own context.
+    """
+    if base is None:
+        base = build_nfl_state_base(scoreboard, event_ticker=event_ticker)
+    state: NFLGameState = base.copy()
+    state["timestamp"] = ts_iso or scoreboard.timestamp.isoformat()
+    state["markets"] = list(markets.values())
+    # The nested context is per-state too, so a consumer that edits one
+    # emission's context does not change the others built from this base
+    state["context"] = {"nfl_raw": base["context"]["nfl_raw"].copy()}
+    return state
@@ -0,0 +1,61 @@
+# src/core/polling.py
+from __future__ import annotations
+
+import time
+from typing import Any, Optional
+
+# Stretched intervals never go below the caller's base interval. Strategies
+# trade on play resuming, so a stoppage or break is never polled slower than
+# a few seconds.
+STALE_POLLS_BEFORE_BACKOFF = 3
+STALE_MAX_SECS = 3.0
+BREAK_SECS = 3.0
+PREGAME_SECS = 30.0
+
+
+def is_break_status(status: str) -> bool:
+    """Halftime / end-of-period status text (NBA CDN and ESPN wording)."""
+    s = status.lower()
+    return "half" in s or "end of" in s or s.startswith("end ")
+
+
+class AdaptivePollInterval:
+    """
+    Poll pacing for one game's scoreboard. Live play polls at `base`; a
+    scoreboard that stops changing (timeouts, reviews) backs off by doubling up
+    to STALE_MAX_SECS and snaps back on the first change; breaks poll every
+    BREAK_SECS and pre-game every PREGAME_SECS. With `tipoff_ns` (epoch ns),
+    pre-game waits never run past tipoff and a game still showing no period
+    after it polls at `base`, whatever its status text says.
+    """
+
+    def __init__(self, base: float, tipoff_ns: Optional[int] = None) -> None:
+        self.base = base
+        self.tipoff_ns = tipoff_ns
+        self._last_key: Optional[Any] = None
+        self._same = 0
+        self._current = base
+
+    def next(self, key: Any, *, status: str, period: int) -> float:
+        """
+        Seconds to wait after a snapshot. `key` is whatever should move during
+        live play (scores, period, clock).
+        """
+        if key == self._last_key:
+            self._same += 1
+        else:
+            self._last_key = key
+            self._same = 0
+            self._current = self.base
+
+        if not period:
+            if self.tipoff_ns is None:
+                return max(self.base, PREGAME_SECS)
+            until_tipoff = (self.tipoff_ns - time.time_ns()) / 1e9
+            return max(self.base, min(PREGAME_SECS, until_tipoff))
+        if is_break_status(status):
+            return max(self.base, BREAK_SECS)
+        if self._same >= STALE_POLLS_BEFORE_BACKOFF:
+            self._current = min(self._current * 2, max(self.base, STALE_MAX_SECS))
+            return self._current
+        return self.base
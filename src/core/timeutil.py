@@ -0,0 +1,21 @@
+# src/core/timeutil.py
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def to_epoch_ns(iso: Optional[str]) -> Optional[int]:
+    """
+    ISO timestamp ("Z" suffix allowed) -> epoch nanoseconds, with naive times
+    taken as UTC. Returns None for an empty or unparseable string.
+    """
+    if not iso:
+        return None
+    try:
+        dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1_000_000_000)
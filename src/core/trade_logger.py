@@ -10,6 +10,12 @@ LOG_BASE_DIR = PROJECT_ROOT / "src" / "storage" / "logs" / "trades"
 
 
 class TradeLogger:
+    """
+    Appends order attempts to a per-sport daily CSV.
+    Rows go through one long-lived line-buffered handle, so every row reaches
+    the OS as soon as it is written; call close() on shutdown.
+    """
+
     def __init__(self, sport: str, dry_run: bool):
         self.sport = sport.lower()
         self.dry_run = dry_run
@@ -24,6 +30,9 @@ class TradeLogger:
 
         self._ensure_header()
 
+        self._file = None
+        self._writer = None
+
     def _ensure_header(self):
         if not self.filepath.exists():
             with open(self.filepath, "w", newline="") as f:
@@ -85,8 +94,28 @@ class TradeLogger:
         ]
 
         try:
-            with open(self.filepath, "a", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(row)
+            if self._writer is None:
+                self._file = open(self.filepath, "a", buffering=1, newline="")
+                self._writer = csv.writer(self._file)
+            self._writer.writerow(row)
         except Exception as e:
             print(f"CRITICAL: Failed to write to trade log: {e}")
+
+    def flush(self):
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+        except Exception as e:
+            print(f"CRITICAL: Failed to flush trade log: {e}")
+
+    def close(self):
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except Exception as e:
+            print(f"CRITICAL: Failed to close trade log: {e}")
+        finally:
+            self._file = None
+            self._writer = None
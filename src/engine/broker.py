@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import uuid
 from dataclasses import dataclass
@@ -201,7 +200,7 @@ class KalshiBroker(Broker):
         # -------------------------------
         if not self.dry_run and payload["action"] == "buy":
             try:
-                bal_resp = await asyncio.to_thread(self.client.get_balance)
+                bal_resp = await self.client.run(self.client.get_balance)
                 # API returns cents
                 balance_cents = int(bal_resp.get("balance", 0))
                 cost_cents = payload["count"] * payload["price_cents"]
@@ -223,7 +222,7 @@ class KalshiBroker(Broker):
             return OrderResult(ok=True, order_id=f"dry-{uuid.uuid4()}", raw={"dry_run": True, "payload": payload})
 
         async def _submit():
-            return await asyncio.to_thread(
+            return await self.client.run(
                 self.client.place_order,
                 market_ticker=payload["market_ticker"],
                 side=payload["side"],
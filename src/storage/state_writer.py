@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+from src.core.jsonio import dumps
 
 # Path definitions
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -13,6 +16,8 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_STATES_DIR = PROJECT_ROOT / "src" / \
     "storage" / "kalshi" / "merged" / "states"
 
+log = logging.getLogger(__name__)
+
 
 class PredictEngineStateWriter:
     """
@@ -45,8 +50,30 @@ class PredictEngineStateWriter:
         """
         Immediately writes the state to the file, maintaining a multi-line JSON array.
         """
-        new_entry_str = json.dumps(state)
-        new_entry_bytes = new_entry_str.encode("utf-8")
+        self.append_states([state])
+
+    def append_states(self, states: List[Dict[str, Any]]) -> None:
+        """
+        Writes a batch of states with a single open/seek/write.
+        """
+        self.append_encoded([self.encode_state(s) for s in states])
+
+    @staticmethod
+    def encode_state(state: Dict[str, Any]) -> bytes:
+        """
+        Serialize a state up front. Market dicts are mutated in place by the
+        mergers, so deferred writers must encode before the next tick.
+        """
+        return dumps(state)
+
+    def append_encoded(self, entries: List[bytes]) -> None:
+        """
+        Writes pre-encoded states (see encode_state) with a single open/seek/write.
+        """
+        if not entries:
+            return
+
+        new_entries_bytes = b",\n".join(entries)
 
         with self.path.open("rb+") as f:
             f.seek(0, 2)  # Go to end
@@ -55,7 +82,7 @@ class PredictEngineStateWriter:
             if file_len <= 2:
                 # File is "[]" -> "[\n{...}\n]"
                 f.seek(-1, 2)
-                f.write(b"\n" + new_entry_bytes + b"\n]")
+                f.write(b"\n" + new_entries_bytes + b"\n]")
             else:
                 # File is "...]" -> "...,\n{...}\n]"
                 # Check for existing newline setup
@@ -64,15 +91,49 @@ class PredictEngineStateWriter:
 
                 if tail == b"\n]":
                     f.seek(-2, 2)
-                    f.write(b",\n" + new_entry_bytes + b"\n]")
+                    f.write(b",\n" + new_entries_bytes + b"\n]")
                 elif tail.endswith(b"]"):
                     f.seek(-1, 2)
-                    f.write(b",\n" + new_entry_bytes + b"\n]")
+                    f.write(b",\n" + new_entries_bytes + b"\n]")
                 else:
                     # Fallback append
-                    f.write(b",\n" + new_entry_bytes + b"\n]")
+                    f.write(b",\n" + new_entries_bytes + b"\n]")
 
-        self._count += 1
+        self._count += len(entries)
 
     def flush(self) -> None:
         pass
+
+
+async def drain_state_queue(
+    queue: asyncio.Queue,
+    writer: PredictEngineStateWriter,
+    *,
+    batch_size: int = 64,
+    max_wait: float = 1.0,
+) -> None:
+    """
+    Write-behind consumer for the live loop: collects up to `batch_size`
+    encoded states (or whatever arrives within `max_wait` seconds) and
+    appends them in one write off the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + max_wait
+        while len(batch) < batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            await asyncio.to_thread(writer.append_encoded, batch)
+        except Exception as e:
+            log.error(f"Failed to write {len(batch)} states: {e}")
+        finally:
+            for _ in batch:
+                queue.task_done()
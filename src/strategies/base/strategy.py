@@ -7,6 +7,7 @@ class TradeIntent:
     market_id: str
     action: str           # "open" or "close"
     position_size: float  # dollars
+    strategy_name: str = "unknown"  # set by CompositeStrategy for logging
 
 
 class Strategy:
@@ -21,8 +21,8 @@ class CompositeStrategy(Strategy):
             intents = strat.on_state(state, portfolio)
 
             for intent in intents:
-                # Monkey-patch or attach the strategy name so the Broker knows who sent it
-                setattr(intent, 'strategy_name', strat.__class__.__name__)
+                # Attach the strategy name so the Broker knows who sent it
+                intent.strategy_name = strat.__class__.__name__
                 all_intents.append(intent)
 
         return all_intents
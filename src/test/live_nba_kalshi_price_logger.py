@@ -12,6 +12,7 @@ from src.connectors.kalshi.http_client import KalshiHTTPClient
 from src.connectors.kalshi.ticker_stream import ticker_stream as kalshi_ticker_stream
 from src.connectors.kalshi.nba_state_merger import merge_nba_and_kalshi_streams
 from src.connectors.nba.scoreboard_client import NBAScoreboardClient, NBAScoreboardError
+from src.core.aio import install_uvloop
 
 from src.engine.live_engine import LiveEngine
 from src.engine.broker import KalshiBroker
@@ -222,6 +223,7 @@ def main() -> None:
         help="Kalshi event ticker, e.g. KXNBAGAME-25DEC02WASPHI",
     )
     args = parser.parse_args()
+    install_uvloop()
     asyncio.run(run(args.event_ticker))
 
 